@@ -45,25 +45,24 @@ def main():
         
         # 2. Analisar notícias com LLM
         logger.info("Analisando notícias com LLM...")
-        analyzed_news = []
         
-        for news in news_data:
-            try:
-                analysis = news_analyzer.analyze_news(news)
-                if analysis:
-                    analyzed_news.append({
-                        **news,
-                        'analysis': analysis
-                    })
-            except Exception as e:
-                logger.error(f"Erro ao analisar notícia: {e}")
-                continue
+        # Análises em paralelo, limitadas por LLM_CONCURRENCY
+        llm_concurrency = int(os.getenv('LLM_CONCURRENCY', '8'))
+        analyses = news_analyzer.analyze_news_batch(news_data, concurrency=llm_concurrency)
+        
+        analyzed_news = [
+            {**news, 'analysis': analysis}
+            for news, analysis in zip(news_data, analyses)
+            if analysis
+        ]
         
         logger.info(f"Analisadas {len(analyzed_news)} notícias")
         
         # 3. Gerar HTML
         logger.info("Gerando HTML...")
-        html_generator.generate_html(analyzed_news)
+        if html_generator.generate_html(analyzed_news):
+            # Só marcar as URLs como vistas depois que o site foi publicado
+            crawler_manager.mark_seen(analyzed_news)
         
         logger.info("Processo concluído com sucesso!")
         
@@ -4,12 +4,13 @@ Scheduler
 Sistema de agendamento para execução diária do AI News Agent
 """
 
-import schedule
-import time
 import logging
+import signal
 import sys
 from datetime import datetime
 from pathlib import Path
+from apscheduler.schedulers.blocking import BlockingScheduler
+from apscheduler.triggers.cron import CronTrigger
 
 # Adicionar o diretório raiz ao path
 sys.path.append(str(Path(__file__).parent))
@@ -36,11 +37,17 @@ def main():
     logger = setup_logger()
     logger.info("Iniciando AI News Agent Scheduler")
     
-    # Agendar execução diária às 08:00
-    schedule.every().day.at("08:00").do(scheduled_job)
+    # Agendar execução diária às 08:00 e às 18:00; o processo fica parado
+    # até o próximo horário em vez de acordar a cada minuto
+    scheduler = BlockingScheduler()
+    scheduler.add_job(scheduled_job, CronTrigger(hour='8,18', minute=0), id='ai_news_agent')
     
-    # Também agendar para às 18:00 (opcional)
-    schedule.every().day.at("18:00").do(scheduled_job)
+    def shutdown(signum, frame):
+        logger.info(f"Sinal {signal.Signals(signum).name} recebido, encerrando scheduler")
+        scheduler.shutdown(wait=False)
+    
+    signal.signal(signal.SIGINT, shutdown)
+    signal.signal(signal.SIGTERM, shutdown)
     
     logger.info("Agendamento configurado:")
     logger.info("- Execução diária às 08:00")
@@ -48,11 +55,10 @@ def main():
     logger.info("Pressione Ctrl+C para parar o scheduler")
     
     try:
-        while True:
-            schedule.run_pending()
-            time.sleep(60)  # Verificar a cada minuto
-            
-    except KeyboardInterrupt:
+        scheduler.start()
+        logger.info("Scheduler encerrado")
+        
+    except (KeyboardInterrupt, SystemExit):
         logger.info("Scheduler interrompido pelo usuário")
     except Exception as e:
         logger.error(f"Erro no scheduler: {e}")
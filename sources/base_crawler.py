@@ -3,25 +3,70 @@ Base Crawler Class
 Classe base para todos os crawlers de notícias
 """
 
+import re
 import requests
+import requests_cache
+import soupsieve
+import threading
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlsplit
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import Container, List, Dict, Optional, Pattern, Tuple
 import logging
-from bs4 import BeautifulSoup
-import time
+from bs4 import BeautifulSoup, SoupStrainer
+from src.utils.news import WHITESPACE_RE
+
+# Tags usadas na extração de artigos; o restante da página (head, scripts de
+# topo, comentários) nem chega a ser montado na árvore
+ARTICLE_STRAINER = SoupStrainer(['title', 'h1', 'article', 'main', 'div', 'time', 'span', 'a', 'p'])
+
+# Limite de HTML passado ao parser de artigos (512 KB): basta para o conteúdo
+# e evita montar a árvore de páginas enormes
+ARTICLE_MAX_CHARS = 524288
+
+def compile_keywords(keywords: List[str]) -> Pattern:
+    """Compilar palavras-chave em uma única regex, buscando todas em uma só passada pelo texto"""
+    return re.compile('|'.join(re.escape(keyword) for keyword in keywords))
+
+def compile_selectors(*selectors: str) -> Tuple[soupsieve.SoupSieve, ...]:
+    """Compilar seletores CSS uma única vez, mantendo a ordem de prioridade"""
+    return tuple(soupsieve.compile(selector) for selector in selectors)
+
+def url_key(url: str) -> Tuple[str, str]:
+    """Chave canônica de uma URL (host + caminho), ignorando query, fragmento e barra final"""
+    parts = urlsplit(url)
+    return parts.netloc.lower(), parts.path.rstrip('/')
 
 class BaseCrawler(ABC):
     """Classe base para crawlers de notícias"""
     
-    def __init__(self, source_name: str, base_url: str):
+    def __init__(self, source_name: str, base_url: str, max_workers: int = 8, max_connections_per_host: int = 4):
         self.source_name = source_name
         self.base_url = base_url
+        self.max_workers = max_workers
         self.logger = logging.getLogger(f"crawler.{source_name}")
-        self.session = requests.Session()
+        # Limitar requisições simultâneas ao mesmo host para ser respeitoso.
+        # O limite cobre apenas o download: com mais threads do que conexões,
+        # o parse de páginas já baixadas não ocupa uma vaga de conexão
+        self._request_slots = threading.Semaphore(max_connections_per_host)
+        # Cache em disco: artigos já baixados nas últimas 12h não são buscados de novo
+        self.session = requests_cache.CachedSession(
+            '.crawler_cache',
+            backend='sqlite',
+            expire_after=43200,
+            allowable_codes=[200]
+        )
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
+        
+        # Pool de conexões keep-alive dimensionado para o limite por host,
+        # evitando que conexões sejam descartadas e reabertas (TCP + TLS)
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max_connections_per_host)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
     
     @abstractmethod
     def get_news_urls(self) -> List[str]:
@@ -33,10 +78,19 @@ class BaseCrawler(ABC):
         """Método abstrato para extrair conteúdo do artigo"""
         pass
     
-    def crawl(self, max_articles: int = 10) -> List[Dict]:
-        """Método principal para fazer crawler das notícias"""
+    def crawl(self, max_articles: int = 10, seen_urls: Optional[Container[str]] = None,
+              crawled_at: Optional[str] = None) -> List[Dict]:
+        """Método principal para fazer crawler das notícias
+        
+        Se seen_urls for informado, URLs já presentes nele são ignoradas. O
+        registro das URLs fica a cargo de quem chama, depois que o lote for
+        publicado. crawled_at permite usar o mesmo timestamp para todo o lote.
+        """
         self.logger.info(f"Iniciando crawler para {self.source_name}")
         
+        if crawled_at is None:
+            crawled_at = datetime.now().isoformat()
+        
         try:
             # Obter URLs das notícias
             news_urls = self.get_news_urls()
@@ -45,27 +99,41 @@ class BaseCrawler(ABC):
                 self.logger.warning(f"Nenhuma URL encontrada para {self.source_name}")
                 return []
             
+            # Ignorar artigos já processados em execuções anteriores
+            if seen_urls is not None:
+                news_urls = [url for url in news_urls if url not in seen_urls]
+                if not news_urls:
+                    self.logger.info(f"Nenhuma URL nova para {self.source_name}")
+                    return []
+            
             # Limitar número de artigos
             news_urls = news_urls[:max_articles]
             
-            articles = []
-            for i, url in enumerate(news_urls):
-                try:
-                    self.logger.info(f"Processando artigo {i+1}/{len(news_urls)}: {url}")
-                    
-                    article = self.extract_article_content(url)
-                    if article:
-                        article['source'] = self.source_name
-                        article['url'] = url
-                        article['crawled_at'] = datetime.now().isoformat()
-                        articles.append(article)
-                    
-                    # Delay entre requisições para ser respeitoso
-                    time.sleep(1)
-                    
-                except Exception as e:
-                    self.logger.error(f"Erro ao processar {url}: {e}")
-                    continue
+            # Baixar e processar artigos em paralelo, mantendo a ordem original
+            results = {}
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = {
+                    executor.submit(self.extract_article_content, url): (i, url)
+                    for i, url in enumerate(news_urls)
+                }
+                
+                for future in as_completed(futures):
+                    i, url = futures[future]
+                    try:
+                        article = future.result()
+                        self.logger.info(f"Artigo processado {i+1}/{len(news_urls)}: {url}")
+                        
+                        if article:
+                            article['source'] = self.source_name
+                            article['url'] = url
+                            article['crawled_at'] = crawled_at
+                            results[i] = article
+                        
+                    except Exception as e:
+                        self.logger.error(f"Erro ao processar {url}: {e}")
+                        continue
+            
+            articles = [results[i] for i in sorted(results)]
             
             self.logger.info(f"Crawler {self.source_name} concluído: {len(articles)} artigos")
             return articles
@@ -74,19 +142,39 @@ class BaseCrawler(ABC):
             self.logger.error(f"Erro no crawler {self.source_name}: {e}")
             return []
     
-    def make_request(self, url: str, timeout: int = 10) -> Optional[requests.Response]:
-        """Fazer requisição HTTP com tratamento de erro"""
+    def make_request(self, url: str, timeout: int = 10, fresh: bool = False) -> Optional[requests.Response]:
+        """Fazer requisição HTTP com tratamento de erro
+        
+        Páginas de listagem e feeds devem usar fresh=True: a resposta fica em
+        cache, mas é revalidada (ETag/Last-Modified) a cada requisição.
+        """
         try:
-            response = self.session.get(url, timeout=timeout)
-            response.raise_for_status()
+            with self._request_slots:
+                kwargs = {'timeout': timeout}
+                if fresh:
+                    kwargs['expire_after'] = requests_cache.EXPIRE_IMMEDIATELY
+                response = self.session.get(url, **kwargs)
+                response.raise_for_status()
+            
             return response
         except requests.RequestException as e:
             self.logger.error(f"Erro na requisição para {url}: {e}")
             return None
     
-    def parse_html(self, html_content: str) -> BeautifulSoup:
-        """Parse do conteúdo HTML"""
-        return BeautifulSoup(html_content, 'html.parser')
+    def parse_html(self, html_content: str, parse_only: Optional[SoupStrainer] = None,
+                   max_chars: Optional[int] = None) -> BeautifulSoup:
+        """Parse do conteúdo HTML, opcionalmente restrito às tags do strainer e aos primeiros max_chars"""
+        if max_chars is not None:
+            html_content = html_content[:max_chars]
+        return BeautifulSoup(html_content, 'lxml', parse_only=parse_only)
+    
+    def select_first(self, soup, selectors: Tuple[soupsieve.SoupSieve, ...]):
+        """Retornar o primeiro elemento encontrado, testando os seletores CSS em ordem de prioridade"""
+        for selector in selectors:
+            elem = selector.select_one(soup)
+            if elem:
+                return elem
+        return None
     
     def clean_text(self, text: str) -> str:
         """Limpar e normalizar texto"""
@@ -94,5 +182,4 @@ class BaseCrawler(ABC):
             return ""
         
         # Remover espaços extras e quebras de linha
-        text = ' '.join(text.split())
-        return text.strip()
\ No newline at end of file
+        return WHITESPACE_RE.sub(' ', text).strip()
\ No newline at end of file
@@ -4,13 +4,18 @@ Crawler específico para notícias de IA do MIT Technology Review
 """
 
 from typing import List, Dict, Optional
-import re
 import feedparser
-from .base_crawler import BaseCrawler
+from .base_crawler import BaseCrawler, ARTICLE_MAX_CHARS, ARTICLE_STRAINER, compile_keywords, compile_selectors, url_key
 
 class MITTechnologyReviewCrawler(BaseCrawler):
     """Crawler para MIT Technology Review - seção de IA"""
     
+    # Seletores CSS compilados uma única vez, em ordem de prioridade
+    _TITLE_SELECTORS = compile_selectors('h1[class*=title i]', 'h1[class*=headline i]', 'h1', 'title')
+    _CONTENT_SELECTORS = compile_selectors('div[class*=content i]', 'div[class*=body i]', 'article', 'main')
+    _DATE_SELECTORS = compile_selectors('time', 'span[class*=date i]', 'div[class*=date i]')
+    _AUTHOR_SELECTORS = compile_selectors('span[class*=author i]', 'a[class*=author i]', 'div[class*=byline i]')
+    
     def __init__(self):
         super().__init__(
             source_name="MIT Technology Review",
@@ -27,28 +32,38 @@ class MITTechnologyReviewCrawler(BaseCrawler):
             'gemini', 'anthropic', 'microsoft ai', 'google ai', 'meta ai',
             'agent', 'ai agent', 'autonomous', 'intelligent system'
         ]
+        self._ai_pattern = compile_keywords(self.ai_keywords)
     
     def get_news_urls(self) -> List[str]:
         """Obter URLs de notícias de IA usando RSS feed"""
         try:
             self.logger.debug(f"Acessando RSS feed: {self.rss_url}")
-            feed = feedparser.parse(self.rss_url)
+            # Baixar pela sessão compartilhada (keep-alive, gzip e cache) e só então fazer o parse
+            response = self.make_request(self.rss_url, fresh=True)
+            if not response:
+                return []
+            feed = feedparser.parse(response.content)
             
             if not feed.entries:
                 self.logger.warning(f"MIT Technology Review: Nenhuma entrada encontrada no RSS feed")
                 return []
             
             ai_urls = []
+            seen = set()
             
             for entry in feed.entries:
                 title = entry.title.lower()
                 summary = getattr(entry, 'summary', '').lower()
                 
                 # Verificar se o artigo é relacionado à IA
-                is_ai_related = any(keyword in title or keyword in summary 
-                                  for keyword in self.ai_keywords)
+                is_ai_related = self._ai_pattern.search(f"{title}\n{summary}") is not None
                 
                 if is_ai_related:
+                    # O feed pode repetir o mesmo artigo
+                    key = url_key(entry.link)
+                    if key in seen:
+                        continue
+                    seen.add(key)
                     ai_urls.append(entry.link)
                     self.logger.debug(f"URL de IA encontrada: {entry.title}")
             
@@ -65,41 +80,33 @@ class MITTechnologyReviewCrawler(BaseCrawler):
         if not response:
             return None
         
-        soup = self.parse_html(response.text)
+        soup = self.parse_html(response.text, parse_only=ARTICLE_STRAINER, max_chars=ARTICLE_MAX_CHARS)
         
         try:
             # Extrair título - tentar múltiplos seletores
-            title_elem = (soup.find('h1', class_=re.compile(r'.*title.*', re.I)) or 
-                         soup.find('h1', class_=re.compile(r'.*headline.*', re.I)) or
-                         soup.find('h1') or
-                         soup.find('title'))
+            title_elem = self.select_first(soup, self._TITLE_SELECTORS)
             title = self.clean_text(title_elem.get_text()) if title_elem else "Título não encontrado"
             
             # Extrair conteúdo do artigo - tentar múltiplos seletores
-            content_elem = (soup.find('div', class_=re.compile(r'.*content.*', re.I)) or
-                           soup.find('div', class_=re.compile(r'.*body.*', re.I)) or
-                           soup.find('article') or
-                           soup.find('main'))
+            content_elem = self.select_first(soup, self._CONTENT_SELECTORS)
             
             if content_elem:
                 # Remover elementos desnecessários
                 for elem in content_elem.find_all(['script', 'style', 'aside', 'nav', 'header', 'footer']):
                     elem.decompose()
                 
-                paragraphs = content_elem.find_all('p')
-                content = ' '.join([self.clean_text(p.get_text()) for p in paragraphs if p.get_text().strip()])
+                # Uma única travessia do container em vez de get_text por parágrafo
+                content = self.clean_text(content_elem.get_text(separator=' ', strip=True))
             else:
                 # Fallback: pegar todos os parágrafos da página
-                paragraphs = soup.find_all('p')
-                content = ' '.join([self.clean_text(p.get_text()) for p in paragraphs[:10] if p.get_text().strip()])
+                paragraphs = soup.find_all('p', limit=10)
+                content = ' '.join(text for text in (self.clean_text(p.get_text()) for p in paragraphs) if text)
             
             if not content.strip():
                 content = "Conteúdo não encontrado"
             
             # Extrair data de publicação
-            date_elem = (soup.find('time') or 
-                        soup.find('span', class_=re.compile(r'.*date.*', re.I)) or
-                        soup.find('div', class_=re.compile(r'.*date.*', re.I)))
+            date_elem = self.select_first(soup, self._DATE_SELECTORS)
             
             published_date = "Data não encontrada"
             if date_elem:
@@ -109,9 +116,7 @@ class MITTechnologyReviewCrawler(BaseCrawler):
                     published_date = self.clean_text(date_elem.get_text())
             
             # Extrair autor
-            author_elem = (soup.find('span', class_=re.compile(r'.*author.*', re.I)) or
-                          soup.find('a', class_=re.compile(r'.*author.*', re.I)) or
-                          soup.find('div', class_=re.compile(r'.*byline.*', re.I)))
+            author_elem = self.select_first(soup, self._AUTHOR_SELECTORS)
             author = self.clean_text(author_elem.get_text()) if author_elem else "Autor não encontrado"
             
             return {
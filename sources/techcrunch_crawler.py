@@ -5,26 +5,42 @@ Crawler específico para notícias de IA do TechCrunch
 
 from typing import List, Dict, Optional
 import re
-from .base_crawler import BaseCrawler
+from bs4 import SoupStrainer
+from .base_crawler import BaseCrawler, ARTICLE_MAX_CHARS, ARTICLE_STRAINER, compile_keywords, compile_selectors, url_key
+
+# Na página de listagem só interessam os links
+LINK_STRAINER = SoupStrainer('a', href=True)
 
 class TechCrunchCrawler(BaseCrawler):
     """Crawler para TechCrunch - seção de IA"""
     
+    # Páginas de listagem que não são artigos
+    _SKIP_RE = re.compile(r'/(category|tag|author|events|newsletter)/')
+    
+    # Seletores CSS compilados uma única vez, em ordem de prioridade
+    _TITLE_SELECTORS = compile_selectors('h1.wp-block-post-title', 'h1')
+    _CONTENT_SELECTORS = compile_selectors('div.entry-content', 'article')
+    _DATE_SELECTORS = compile_selectors('time', 'span.date')
+    _AUTHOR_SELECTORS = compile_selectors('a.author', 'span.author')
+    
     def __init__(self):
         super().__init__(
             source_name="TechCrunch",
             base_url="https://techcrunch.com"
         )
         self.ai_section_url = "https://techcrunch.com/category/artificial-intelligence/"
+        self.ai_keywords = ['ai', 'artificial intelligence', 'machine learning', 'llm', 'gpt', 'openai', 'anthropic', 'chatgpt', 'claude', 'gemini']
+        self._ai_pattern = compile_keywords(self.ai_keywords)
     
     def get_news_urls(self) -> List[str]:
         """Obter URLs das notícias de IA do TechCrunch"""
-        response = self.make_request(self.ai_section_url)
+        response = self.make_request(self.ai_section_url, fresh=True)
         if not response:
             return []
         
-        soup = self.parse_html(response.text)
+        soup = self.parse_html(response.text, parse_only=LINK_STRAINER)
         urls = []
+        seen = set()
         
         # Procurar por links de artigos - seletores mais específicos
         article_links = soup.find_all('a', href=True, class_=lambda x: x and ('post-block__title__link' in x or 'river-block__title-link' in x))
@@ -37,10 +53,16 @@ class TechCrunchCrawler(BaseCrawler):
             href = link.get('href')
             # Aceitar qualquer artigo do TechCrunch, não apenas de 2024/2025
             if href and 'techcrunch.com' in href and '/20' in href:
+                if self._SKIP_RE.search(href):
+                    continue
+                
                 # Filtrar apenas artigos relacionados a IA
                 title = link.get_text().lower()
-                if any(keyword in title for keyword in ['ai', 'artificial intelligence', 'machine learning', 'llm', 'gpt', 'openai', 'anthropic', 'chatgpt', 'claude', 'gemini']):
-                    if href not in urls:
+                if self._ai_pattern.search(title):
+                    # Evitar duplicatas do mesmo artigo (query string, âncoras, barra final)
+                    key = url_key(href)
+                    if key not in seen:
+                        seen.add(key)
                         urls.append(href)
         
         return urls[:15]  # Limitar a 15 URLs
@@ -51,31 +73,31 @@ class TechCrunchCrawler(BaseCrawler):
         if not response:
             return None
         
-        soup = self.parse_html(response.text)
+        soup = self.parse_html(response.text, parse_only=ARTICLE_STRAINER, max_chars=ARTICLE_MAX_CHARS)
         
         try:
             # Extrair título
-            title_elem = soup.find('h1', class_='wp-block-post-title') or soup.find('h1')
+            title_elem = self.select_first(soup, self._TITLE_SELECTORS)
             title = self.clean_text(title_elem.get_text()) if title_elem else "Título não encontrado"
             
             # Extrair conteúdo do artigo
-            content_elem = soup.find('div', class_='entry-content') or soup.find('article')
+            content_elem = self.select_first(soup, self._CONTENT_SELECTORS)
             if content_elem:
                 # Remover elementos desnecessários
                 for elem in content_elem.find_all(['script', 'style', 'aside', 'nav']):
                     elem.decompose()
                 
-                paragraphs = content_elem.find_all('p')
-                content = ' '.join([self.clean_text(p.get_text()) for p in paragraphs])
+                # Uma única travessia do container em vez de get_text por parágrafo
+                content = self.clean_text(content_elem.get_text(separator=' ', strip=True))
             else:
                 content = "Conteúdo não encontrado"
             
             # Extrair data de publicação
-            date_elem = soup.find('time') or soup.find('span', class_='date')
+            date_elem = self.select_first(soup, self._DATE_SELECTORS)
             published_date = date_elem.get('datetime') if date_elem and date_elem.get('datetime') else "Data não encontrada"
             
             # Extrair autor
-            author_elem = soup.find('a', class_='author') or soup.find('span', class_='author')
+            author_elem = self.select_first(soup, self._AUTHOR_SELECTORS)
             author = self.clean_text(author_elem.get_text()) if author_elem else "Autor não encontrado"
             
             return {
@@ -4,16 +4,46 @@ Gerenciador que coordena todos os crawlers de notícias
 """
 
 import os
-import json
+import hashlib
 import logging
+import shelve
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 from pathlib import Path
+import orjson
+
+from src.utils.news import get_source
 
 # Importar crawlers
 from sources.techcrunch_crawler import TechCrunchCrawler
 from sources.mit_technology_review_crawler import MITTechnologyReviewCrawler
 
+class SeenURLStore:
+    """Registro persistente das URLs já processadas, compartilhado entre os crawlers"""
+    
+    def __init__(self, path: Path):
+        self._db = shelve.open(str(path))
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _key(url: str) -> str:
+        # Hash curto para manter as chaves pequenas
+        return hashlib.blake2b(url.encode(), digest_size=8).hexdigest()
+    
+    def __contains__(self, url: str) -> bool:
+        with self._lock:
+            return self._key(url) in self._db
+    
+    def __setitem__(self, url: str, crawled_at: str):
+        with self._lock:
+            self._db[self._key(url)] = crawled_at
+    
+    def close(self):
+        with self._lock:
+            self._db.close()
+
 class CrawlerManager:
     """Gerenciador de crawlers de notícias"""
     
@@ -22,6 +52,14 @@ class CrawlerManager:
         self.output_dir = Path(os.getenv('OUTPUT_DIR', 'news_data'))
         self.output_dir.mkdir(exist_ok=True)
         
+        # Timestamp único do lote de coleta, reutilizado em artigos e arquivos
+        self._batch_ts = datetime.now()
+        
+        # Registro de URLs já publicadas: fora do diretório de saída, que é versionado.
+        # Desligado por padrão, pois o site só mostra o que foi coletado na execução
+        self.skip_seen_urls = os.getenv('SKIP_SEEN_URLS', 'false').lower() == 'true'
+        self.seen_urls_path = Path(os.getenv('SEEN_URLS_PATH', '.seen_urls'))
+        
         # Inicializar crawlers
         self.crawlers = [
             TechCrunchCrawler(),
@@ -32,25 +70,38 @@ class CrawlerManager:
         """Executar crawler em todas as fontes"""
         self.logger.info("Iniciando crawler em todas as fontes")
         
+        self._batch_ts = datetime.now()
+        
         all_news = []
         
-        for crawler in self.crawlers:
-            try:
-                self.logger.info(f"Executando crawler: {crawler.source_name}")
-                
-                max_articles = int(os.getenv('MAX_NEWS_PER_SOURCE', 10))
-                news = crawler.crawl(max_articles=max_articles)
+        # URLs já publicadas em execuções anteriores não são baixadas de novo
+        seen_urls = None
+        if self.skip_seen_urls:
+            seen_urls = SeenURLStore(self.seen_urls_path)
+        
+        try:
+            # Fontes são independentes: executar cada crawler em sua própria thread
+            with ThreadPoolExecutor(max_workers=len(self.crawlers)) as executor:
+                futures = {executor.submit(self._run_one, crawler, seen_urls): crawler for crawler in self.crawlers}
+                results = {}
                 
-                if news:
-                    all_news.extend(news)
-                    self.save_news_to_file(news, crawler.source_name)
-                    self.logger.info(f"{crawler.source_name}: {len(news)} notícias coletadas")
-                else:
-                    self.logger.warning(f"{crawler.source_name}: Nenhuma notícia coletada")
-                    
-            except Exception as e:
-                self.logger.error(f"Erro no crawler {crawler.source_name}: {e}")
-                continue
+                for future in as_completed(futures):
+                    crawler = futures[future]
+                    try:
+                        name, news = future.result()
+                        results[name] = news
+                    except Exception as e:
+                        self.logger.error(f"Erro no crawler {crawler.source_name}: {e}")
+        finally:
+            if seen_urls is not None:
+                seen_urls.close()
+        
+        # Gravações em disco ficam na thread principal, na ordem dos crawlers
+        for crawler in self.crawlers:
+            news = results.get(crawler.source_name)
+            if news:
+                all_news.extend(news)
+                self.save_news_to_file(news, crawler.source_name)
         
         self.logger.info(f"Crawler concluído: {len(all_news)} notícias no total")
         
@@ -60,27 +111,62 @@ class CrawlerManager:
         
         return all_news
     
+    def mark_seen(self, news: List[Dict]):
+        """Registrar as URLs das notícias publicadas, para não coletá-las de novo"""
+        if not self.skip_seen_urls:
+            return
+        
+        seen_urls = SeenURLStore(self.seen_urls_path)
+        try:
+            for article in news:
+                url = article.get('url')
+                if url:
+                    seen_urls[url] = article.get('crawled_at', self._batch_ts.isoformat())
+        finally:
+            seen_urls.close()
+    
+    def _run_one(self, crawler, seen_urls: Optional[SeenURLStore] = None) -> Tuple[str, List[Dict]]:
+        """Executar o crawler de uma única fonte"""
+        self.logger.info(f"Executando crawler: {crawler.source_name}")
+        
+        max_articles = int(os.getenv('MAX_NEWS_PER_SOURCE', 10))
+        news = crawler.crawl(max_articles=max_articles, seen_urls=seen_urls,
+                             crawled_at=self._batch_ts.isoformat())
+        
+        if news:
+            self.logger.info(f"{crawler.source_name}: {len(news)} notícias coletadas")
+        else:
+            self.logger.warning(f"{crawler.source_name}: Nenhuma notícia coletada")
+        
+        return crawler.source_name, news
+    
     def save_news_to_file(self, news: List[Dict], source_name: str):
         """Salvar notícias de uma fonte específica em arquivo"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = self._batch_ts.strftime("%Y%m%d_%H%M%S")
         filename = f"{source_name.lower().replace(' ', '_')}_{timestamp}.txt"
         filepath = self.output_dir / filename
         
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(f"# Notícias de {source_name}\\n")
-                f.write(f"# Coletadas em: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\\n")
-                f.write(f"# Total de notícias: {len(news)}\\n\\n")
-                
-                for i, article in enumerate(news, 1):
-                    f.write(f"## Notícia {i}\\n")
-                    f.write(f"**Título:** {article.get('title', 'N/A')}\\n")
-                    f.write(f"**Autor:** {article.get('author', 'N/A')}\\n")
-                    f.write(f"**Data:** {article.get('published_date', 'N/A')}\\n")
-                    f.write(f"**URL:** {article.get('url', 'N/A')}\\n")
-                    f.write(f"**Resumo:** {article.get('summary', 'N/A')}\\n")
-                    f.write(f"**Conteúdo:** {article.get('content', 'N/A')}\\n")
-                    f.write("\\n" + "="*80 + "\\n\\n")
+            # Montar o arquivo inteiro em memória e gravar de uma só vez
+            parts = [
+                f"# Notícias de {source_name}\n",
+                f"# Coletadas em: {self._batch_ts.strftime('%Y-%m-%d %H:%M:%S')}\n",
+                f"# Total de notícias: {len(news)}\n\n"
+            ]
+            
+            for i, article in enumerate(news, 1):
+                parts.append(
+                    f"## Notícia {i}\n"
+                    f"**Título:** {article.get('title', 'N/A')}\n"
+                    f"**Autor:** {article.get('author', 'N/A')}\n"
+                    f"**Data:** {article.get('published_date', 'N/A')}\n"
+                    f"**URL:** {article.get('url', 'N/A')}\n"
+                    f"**Resumo:** {article.get('summary', 'N/A')}\n"
+                    f"**Conteúdo:** {article.get('content', 'N/A')}\n"
+                    "\n" + "="*80 + "\n\n"
+                )
+            
+            filepath.write_text(''.join(parts), encoding='utf-8')
             
             self.logger.info(f"Notícias de {source_name} salvas em: {filepath}")
             
@@ -89,18 +175,20 @@ class CrawlerManager:
     
     def save_consolidated_news(self, all_news: List[Dict]):
         """Salvar todas as notícias em um arquivo consolidado JSON"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = self._batch_ts.strftime("%Y%m%d_%H%M%S")
         filename = f"consolidated_news_{timestamp}.json"
         filepath = self.output_dir / filename
         
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump({
-                    'timestamp': datetime.now().isoformat(),
-                    'total_news': len(all_news),
-                    'sources': list(set([news['source'] for news in all_news])),
-                    'news': all_news
-                }, f, ensure_ascii=False, indent=2)
+            payload = {
+                'timestamp': self._batch_ts.isoformat(),
+                'total_news': len(all_news),
+                'sources': list(set(map(get_source, all_news))),
+                'news': all_news
+            }
+            
+            # orjson já gera UTF-8 sem escapar caracteres não-ASCII
+            filepath.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
             
             self.logger.info(f"Notícias consolidadas salvas em: {filepath}")
             
@@ -4,228 +4,38 @@ Gerador de HTML para GitHub Pages
 """
 
 import os
-import json
+import gzip
+import hashlib
+import html
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Set
 import logging
+import orjson
+from src.utils.news import get_source
 
-class HTMLGenerator:
-    """Gerador de HTML para exibir notícias no GitHub Pages"""
-    
-    def __init__(self):
-        self.logger = logging.getLogger("html_generator")
-        self.output_dir = Path(os.getenv('HTML_OUTPUT_DIR', 'docs'))
-        self.output_dir.mkdir(exist_ok=True)
-    
-    def generate_html(self, analyzed_news: List[Dict]):
-        """Gerar HTML com as notícias analisadas"""
-        
-        if not analyzed_news:
-            self.logger.warning("Nenhuma notícia para gerar HTML")
-            return
-        
-        try:
-            # Gerar página principal
-            self._generate_index_page(analyzed_news)
-            
-            # Gerar CSS
-            self._generate_css()
-            
-            # Gerar JavaScript
-            self._generate_js()
-            
-            # Gerar arquivo JSON para API
-            self._generate_json_api(analyzed_news)
-            
-            self.logger.info(f"HTML gerado com sucesso em: {self.output_dir}")
-            
-        except Exception as e:
-            self.logger.error(f"Erro ao gerar HTML: {e}")
-    
-    def _generate_index_page(self, analyzed_news: List[Dict]):
-        """Gerar página principal HTML"""
-        
-        html_content = f"""<!DOCTYPE html>
-<html lang="pt-BR">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>IA BONNER - Notícias de IA</title>
-    <link rel="stylesheet" href="styles.css">
-    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap" rel="stylesheet">
-    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css">
-</head>
-<body>
-    <header class="header">
-        <div class="container">
-            <div class="header-content">
-                <h1><i class="fas fa-robot"></i> AI News Agent</h1>
-                <p class="subtitle">Notícias de IA para Desenvolvedores e Empresas</p>
-                <div class="update-info">
-                    <i class="fas fa-clock"></i>
-                    Última atualização: {datetime.now().strftime('%d/%m/%Y às %H:%M')}
-                </div>
-            </div>
-        </div>
-    </header>
-
-    <main class="main">
-        <div class="container">
-            <div class="stats-section">
-                <div class="stat-card">
-                    <i class="fas fa-newspaper"></i>
-                    <div class="stat-info">
-                        <span class="stat-number">{len(analyzed_news)}</span>
-                        <span class="stat-label">Notícias Analisadas</span>
-                    </div>
-                </div>
-                <div class="stat-card">
-                    <i class="fas fa-globe"></i>
-                    <div class="stat-info">
-                        <span class="stat-number">{len(set([news['source'] for news in analyzed_news]))}</span>
-                        <span class="stat-label">Fontes</span>
-                    </div>
-                </div>
-                <div class="stat-card">
-                    <i class="fas fa-brain"></i>
-                    <div class="stat-info">
-                        <span class="stat-number">100%</span>
-                        <span class="stat-label">Análise IA</span>
-                    </div>
-                </div>
-            </div>
+# Versão do HTML gerado: incrementar ao mudar _build_index_page, _render_card ou _prepare_card
+# (invalida o cache de cards e o marcador da última execução)
+_CARD_CACHE_VERSION = 1
 
-            <div class="filters">
-                <button class="filter-btn active" data-filter="all">Todas</button>
-                <button class="filter-btn" data-filter="alto">Alta Relevância</button>
-                <button class="filter-btn" data-filter="medio">Média Relevância</button>
-                <button class="filter-btn" data-filter="baixo">Baixa Relevância</button>
-            </div>
+# Arquivos publicados que precisam existir para a geração poder ser pulada
+_OUTPUT_FILES = ('index.html', 'styles.css', 'script.js', 'api.json', 'api.ndjson', 'api_meta.json')
 
-            <div class="news-grid" id="newsGrid">
-                {self._generate_news_cards(analyzed_news)}
-            </div>
-        </div>
-    </main>
+# Ícones repetidos em todos os cards, montados uma única vez
+_ICON_LIST = '<i class="fas fa-list"></i>'
+_ICON_LINK = '<i class="fas fa-external-link-alt"></i>'
+_ICON_CLOCK = '<i class="fas fa-clock"></i>'
 
-    <footer class="footer">
-        <div class="container">
-            <p>&copy; 2025 Paulo Marcelo - AI News Agent.</p>
-        </div>
-    </footer>
+# Classe, ícone (HTML pronto), cor e rótulo do badge para cada nível de relevância
+_RELEVANCIA = {
+    'alto': ('alto', '<i class="fas fa-fire"></i>', '#e74c3c', 'Alto'),
+    'baixo': ('baixo', '<i class="fas fa-leaf"></i>', '#95a5a6', 'Baixo'),
+    'medio': ('medio', '<i class="fas fa-star"></i>', '#f39c12', 'Medio')
+}
 
-    <script src="script.js"></script>
-</body>
-</html>"""
-        
-        with open(self.output_dir / "index.html", 'w', encoding='utf-8') as f:
-            f.write(html_content)
-    
-    def _generate_news_cards(self, analyzed_news: List[Dict]) -> str:
-        """Gerar cards das notícias"""
-        
-        cards_html = ""
-        
-        for i, news in enumerate(analyzed_news):
-            analysis = news.get('analysis', {})
-            
-            # Determinar nível de relevância
-            relevancia = analysis.get('nivel_relevancia', 'Médio').lower()
-            if 'alto' in relevancia:
-                relevancia_class = 'alto'
-                relevancia_icon = 'fas fa-fire'
-                relevancia_color = '#e74c3c'
-            elif 'baixo' in relevancia:
-                relevancia_class = 'baixo'
-                relevancia_icon = 'fas fa-leaf'
-                relevancia_color = '#95a5a6'
-            else:
-                relevancia_class = 'medio'
-                relevancia_icon = 'fas fa-star'
-                relevancia_color = '#f39c12'
-            
-            cards_html += f"""
-            <article class="news-card" data-relevancia="{relevancia_class}">
-                <div class="news-header">
-                    <div class="source-info">
-                        <span class="source">{news.get('source', 'N/A')}</span>
-                        <span class="date">{self._format_date(news.get('published_date', ''))}</span>
-                    </div>
-                    <div class="relevancia-badge" style="color: {relevancia_color}">
-                        <i class="{relevancia_icon}"></i>
-                        {relevancia_class.title()}
-                    </div>
-                </div>
-                
-                <h2 class="news-title">{news.get('title', 'Título não disponível')}</h2>
-                
-                <div class="news-summary">
-                    {analysis.get('resumo_executivo', 'Resumo não disponível')}
-                </div>
-                
-                <div class="analysis-sections">                                                                    
-                    <div class="analysis-section">
-                        <h3><i class="fas fa-list"></i> Pontos-Chave</h3>
-                        <div class="pontos-chave">
-                            {self._format_pontos_chave(analysis.get('pontos_chave', ''))}
-                        </div>
-                    </div>
-                </div>
-                
-                <div class="news-footer">
-                    <a href="{news.get('url', '#')}" target="_blank" class="read-more">
-                        <i class="fas fa-external-link-alt"></i>
-                        Ler notícia completa
-                    </a>
-                    <span class="author">Por: {news.get('author', 'Autor não informado')}</span>
-                </div>
-            </article>
-            """
-        
-        return cards_html
-    
-    def _format_pontos_chave(self, pontos_chave: str) -> str:
-        """Formatar pontos-chave como lista HTML"""
-        if not pontos_chave:
-            return "<p>Pontos-chave não disponíveis</p>"
-        
-        lines = pontos_chave.split('\\n')
-        formatted_lines = []
-        
-        for line in lines:
-            line = line.strip()
-            if line and (line.startswith('•') or line.startswith('-')):
-                # Remover marcador e adicionar como item de lista
-                text = line[1:].strip()
-                formatted_lines.append(f"<li>{text}</li>")
-        
-        if formatted_lines:
-            return f"<ul>{''.join(formatted_lines)}</ul>"
-        else:
-            return f"<p>{pontos_chave}</p>"
-    
-    def _format_date(self, date_str: str) -> str:
-        """Formatar data para exibição"""
-        if not date_str or date_str == "Data não encontrada":
-            return "Data não disponível"
-        
-        try:
-            # Tentar diferentes formatos de data
-            for fmt in ['%Y-%m-%dT%H:%M:%S', '%Y-%m-%d', '%d/%m/%Y']:
-                try:
-                    dt = datetime.strptime(date_str[:19], fmt)
-                    return dt.strftime('%d/%m/%Y')
-                except ValueError:
-                    continue
-            return date_str
-        except:
-            return "Data não disponível"
-    
-    def _generate_css(self):
-        """Gerar arquivo CSS"""
-        
-        css_content = """
+# Assets estáticos: conteúdo fixo, codificado uma única vez na importação
+_CSS_BYTES = """
 /* Reset e Base */
 * {
     margin: 0;
@@ -383,6 +193,16 @@ body {
     box-shadow: 0 10px 30px rgba(0, 0, 0, 0.1);
     transition: all 0.3s ease;
     border: 1px solid rgba(255, 255, 255, 0.2);
+    /* Cards fora da tela não entram no cálculo de layout */
+    content-visibility: auto;
+    contain-intrinsic-size: auto 400px;
+}
+
+/* Filtros de relevância aplicados por classe no grid */
+.news-grid.f-alto .news-card:not([data-relevancia="alto"]),
+.news-grid.f-medio .news-card:not([data-relevancia="medio"]),
+.news-grid.f-baixo .news-card:not([data-relevancia="baixo"]) {
+    display: none;
 }
 
 .news-card:hover {
@@ -565,19 +385,13 @@ body {
 .news-card:nth-child(odd) {
     animation-delay: 0.2s;
 }
-"""
-        
-        with open(self.output_dir / "styles.css", 'w', encoding='utf-8') as f:
-            f.write(css_content)
-    
-    def _generate_js(self):
-        """Gerar arquivo JavaScript"""
-        
-        js_content = """
+""".encode('utf-8')
+
+_JS_BYTES = """
 // Funcionalidade de filtros
 document.addEventListener('DOMContentLoaded', function() {
     const filterButtons = document.querySelectorAll('.filter-btn');
-    const newsCards = document.querySelectorAll('.news-card');
+    const newsGrid = document.getElementById('newsGrid');
     
     filterButtons.forEach(button => {
         button.addEventListener('click', function() {
@@ -589,19 +403,10 @@ document.addEventListener('DOMContentLoaded', function() {
             
             const filter = this.getAttribute('data-filter');
             
-            // Filtrar cards
-            newsCards.forEach(card => {
-                if (filter === 'all') {
-                    card.style.display = 'block';
-                } else {
-                    const relevancia = card.getAttribute('data-relevancia');
-                    if (relevancia === filter) {
-                        card.style.display = 'block';
-                    } else {
-                        card.style.display = 'none';
-                    }
-                }
-            });
+            // Filtrar cards: uma classe no grid, as regras de CSS escondem os demais
+            if (newsGrid) {
+                newsGrid.className = filter === 'all' ? 'news-grid' : 'news-grid f-' + filter;
+            }
         });
     });
     
@@ -620,7 +425,6 @@ document.addEventListener('DOMContentLoaded', function() {
     });
     
     // Adicionar efeito de loading
-    const newsGrid = document.getElementById('newsGrid');
     if (newsGrid) {
         newsGrid.style.opacity = '0';
         setTimeout(() => {
@@ -642,20 +446,389 @@ function updateTimestamp() {
 
 // Atualizar timestamp a cada minuto
 setInterval(updateTimestamp, 60000);
-"""
+""".encode('utf-8')
+
+class HTMLGenerator:
+    """Gerador de HTML para exibir notícias no GitHub Pages"""
+    
+    def __init__(self):
+        self.logger = logging.getLogger("html_generator")
+        self.output_dir = Path(os.getenv('HTML_OUTPUT_DIR', 'docs'))
+        self.output_dir.mkdir(exist_ok=True)
+        # Estado interno entre execuções, fora do diretório publicado
+        self.cache_dir = Path(os.getenv('HTML_CACHE_DIR', '.html_cache'))
+        self.cache_dir.mkdir(exist_ok=True)
+    
+    def generate_html(self, analyzed_news: List[Dict]) -> bool:
+        """Gerar HTML com as notícias analisadas
+        
+        Retorna True se o site estiver atualizado com as notícias informadas.
+        """
+        
+        if not analyzed_news:
+            self.logger.warning("Nenhuma notícia para gerar HTML")
+            return False
+        
+        # Versão indentada da API apenas para depuração; desligada, a cópia antiga sai do site
+        pretty_json = os.getenv('IABONNER_PRETTY_JSON', 'false').lower() in ('1', 'true')
+        output_files = _OUTPUT_FILES
+        if pretty_json:
+            output_files += ('api.pretty.json',)
+        else:
+            (self.output_dir / "api.pretty.json").unlink(missing_ok=True)
+        
+        # Pular a geração quando as notícias e os templates são os mesmos da última execução
+        # e o site publicado ainda está no diretório de saída
+        digest = self._content_digest(analyzed_news)
+        marker = self.cache_dir / "lastrun"
+        if (marker.exists() and marker.read_text() == digest
+                and all((self.output_dir / name).exists() for name in output_files)):
+            self.logger.info("Notícias inalteradas desde a última execução, HTML mantido")
+            return True
+        
+        # Estatísticas calculadas uma única vez para a página e a API
+        sources = set(map(get_source, analyzed_news))
+        total = len(analyzed_news)
+        
+        # Um único instante para a página e a API
+        now = datetime.now()
+        display_ts = f"{now.day:02d}/{now.month:02d}/{now.year} às {now.hour:02d}:{now.minute:02d}"
+        iso_ts = now.isoformat()
+        
+        try:
+            # Montar o conteúdo na thread principal (trabalho de CPU)
+            html_content = self._build_index_page(analyzed_news, sources, total, display_ts)
+            api_meta = self._build_api_meta(analyzed_news, sources, iso_ts)
+            api_payload = self._build_json_api(analyzed_news, api_meta)
+            
+            # Arquivos independentes: gravar em paralelo (I/O libera o GIL)
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                futures = [
+                    executor.submit(self._write_index_page, html_content),
+                    executor.submit(self._generate_css),
+                    executor.submit(self._generate_js),
+                    executor.submit(self._write_json_api, api_payload),
+                    executor.submit(self._write_ndjson_api, analyzed_news, api_meta)
+                ]
+                if pretty_json:
+                    futures.append(executor.submit(self._write_pretty_json_api, analyzed_news, api_meta))
+                for future in futures:
+                    future.result()
+            
+            marker.write_text(digest)
+            
+            self.logger.info(f"HTML gerado com sucesso em: {self.output_dir}")
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Erro ao gerar HTML: {e}")
+            return False
+    
+    def _content_digest(self, analyzed_news: List[Dict]) -> str:
+        """Hash do que é publicado: notícias (sem crawled_at, que muda a cada lote), CSS, JS e versão dos cards"""
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(orjson.dumps([
+            {k: v for k, v in news.items() if k != 'crawled_at'}
+            for news in analyzed_news
+        ]))
+        hasher.update(_CSS_BYTES)
+        hasher.update(_JS_BYTES)
+        hasher.update(str(_CARD_CACHE_VERSION).encode())
+        return hasher.hexdigest()
+    
+    def _build_index_page(self, analyzed_news: List[Dict], sources: Set[str], total: int, display_ts: str) -> str:
+        """Montar a página principal HTML"""
+        
+        html_content = f"""<!DOCTYPE html>
+<html lang="pt-BR">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>IA BONNER - Notícias de IA</title>
+    <link rel="stylesheet" href="styles.css">
+    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap" rel="stylesheet">
+    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css">
+</head>
+<body>
+    <header class="header">
+        <div class="container">
+            <div class="header-content">
+                <h1><i class="fas fa-robot"></i> AI News Agent</h1>
+                <p class="subtitle">Notícias de IA para Desenvolvedores e Empresas</p>
+                <div class="update-info">
+                    {_ICON_CLOCK}
+                    Última atualização: {display_ts}
+                </div>
+            </div>
+        </div>
+    </header>
+
+    <main class="main">
+        <div class="container">
+            <div class="stats-section">
+                <div class="stat-card">
+                    <i class="fas fa-newspaper"></i>
+                    <div class="stat-info">
+                        <span class="stat-number">{total}</span>
+                        <span class="stat-label">Notícias Analisadas</span>
+                    </div>
+                </div>
+                <div class="stat-card">
+                    <i class="fas fa-globe"></i>
+                    <div class="stat-info">
+                        <span class="stat-number">{len(sources)}</span>
+                        <span class="stat-label">Fontes</span>
+                    </div>
+                </div>
+                <div class="stat-card">
+                    <i class="fas fa-brain"></i>
+                    <div class="stat-info">
+                        <span class="stat-number">100%</span>
+                        <span class="stat-label">Análise IA</span>
+                    </div>
+                </div>
+            </div>
+
+            <div class="filters">
+                <button class="filter-btn active" data-filter="all">Todas</button>
+                <button class="filter-btn" data-filter="alto">Alta Relevância</button>
+                <button class="filter-btn" data-filter="medio">Média Relevância</button>
+                <button class="filter-btn" data-filter="baixo">Baixa Relevância</button>
+            </div>
+
+            <div class="news-grid" id="newsGrid">
+                {self._generate_news_cards(analyzed_news)}
+            </div>
+        </div>
+    </main>
+
+    <footer class="footer">
+        <div class="container">
+            <p>&copy; 2025 Paulo Marcelo - AI News Agent.</p>
+        </div>
+    </footer>
+
+    <script src="script.js"></script>
+</body>
+</html>"""
+        
+        return html_content
+    
+    def _write_index_page(self, html_content: str):
+        """Gravar a página principal HTML"""
+        self._write_if_changed(self.output_dir / "index.html", html_content.encode('utf-8'))
+    
+    def _generate_news_cards(self, analyzed_news: List[Dict]) -> str:
+        """Gerar cards das notícias"""
+        
+        # Cards de notícias inalteradas são reaproveitados da execução anterior
+        cache_path = self.cache_dir / "cards.json"
+        cache = self._load_card_cache(cache_path)
+        new_cache = {}
+        parts: List[str] = []
         
-        with open(self.output_dir / "script.js", 'w', encoding='utf-8') as f:
-            f.write(js_content)
+        for news in analyzed_news:
+            url = news.get('url', '')
+            digest = self._card_digest(news)
+            cached = cache.get(url)
+            
+            if cached and cached[0] == digest:
+                card_html = cached[1]
+            else:
+                card_html = self._render_card(self._prepare_card(news))
+            
+            if url:
+                new_cache[url] = [digest, card_html]
+            parts.append(card_html)
+        
+        # Guardar apenas os cards da página atual, para o cache não crescer sem limite
+        self._save_card_cache(cache_path, new_cache)
+        
+        return "".join(parts)
+    
+    def _card_digest(self, news: Dict) -> str:
+        """Hash apenas dos campos exibidos no card (crawled_at muda a cada lote e não entra)"""
+        get = news.get
+        analysis = get('analysis', {})
+        return hashlib.blake2b(orjson.dumps([
+            get('source'), get('published_date'), get('title'), get('url'), get('author'),
+            analysis.get('nivel_relevancia'), analysis.get('resumo_executivo'), analysis.get('pontos_chave')
+        ]), digest_size=8).hexdigest()
+    
+    def _load_card_cache(self, cache_path: Path) -> Dict:
+        """Carregar o cache de cards renderizados"""
+        try:
+            data = orjson.loads(cache_path.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return {}
+        
+        # Cards de outra versão do template são descartados
+        if data.get('version') != _CARD_CACHE_VERSION:
+            return {}
+        return data.get('cards', {})
+    
+    def _save_card_cache(self, cache_path: Path, cards: Dict):
+        """Gravar o cache de cards de forma atômica"""
+        try:
+            tmp_path = cache_path.with_name(cache_path.name + '.tmp')
+            tmp_path.write_bytes(orjson.dumps({'version': _CARD_CACHE_VERSION, 'cards': cards}))
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            self.logger.warning(f"Erro ao salvar cache de cards: {e}")
     
-    def _generate_json_api(self, analyzed_news: List[Dict]):
-        """Gerar arquivo JSON para API"""
+    def _prepare_card(self, news: Dict) -> Dict:
+        """Resolver os valores de exibição de um card"""
+        # Métodos resolvidos uma única vez por card
+        get = news.get
+        analysis = get('analysis', {})
+        analysis_get = analysis.get
+        escape = html.escape
         
-        api_data = {
-            'timestamp': datetime.now().isoformat(),
+        # Determinar nível de relevância
+        relevancia = analysis_get('nivel_relevancia', 'Médio').lower()
+        key = 'alto' if 'alto' in relevancia else 'baixo' if 'baixo' in relevancia else 'medio'
+        relevancia_class, relevancia_icon, relevancia_color, relevancia_label = _RELEVANCIA[key]
+        
+        # Escapar os textos uma única vez, na preparação do card
+        return {
+            'relevancia_class': relevancia_class,
+            'relevancia_icon': relevancia_icon,
+            'relevancia_color': relevancia_color,
+            'relevancia_label': relevancia_label,
+            'source': escape(get('source', 'N/A')),
+            'date': escape(self._format_date(get('published_date', ''))),
+            'title': escape(get('title', 'Título não disponível')),
+            'resumo': escape(analysis_get('resumo_executivo', 'Resumo não disponível')),
+            'pontos_chave': self._format_pontos_chave(analysis_get('pontos_chave', '')),
+            'url': escape(get('url', '#')),
+            'author': escape(get('author', 'Autor não informado'))
+        }
+    
+    def _render_card(self, card: Dict) -> str:
+        """Renderizar o HTML de um card já preparado"""
+        return f"""
+            <article class="news-card" data-relevancia="{card['relevancia_class']}">
+                <div class="news-header">
+                    <div class="source-info">
+                        <span class="source">{card['source']}</span>
+                        <span class="date">{card['date']}</span>
+                    </div>
+                    <div class="relevancia-badge" style="color: {card['relevancia_color']}">
+                        {card['relevancia_icon']}
+                        {card['relevancia_label']}
+                    </div>
+                </div>
+                
+                <h2 class="news-title">{card['title']}</h2>
+                
+                <div class="news-summary">
+                    {card['resumo']}
+                </div>
+                
+                <div class="analysis-sections">                                                                    
+                    <div class="analysis-section">
+                        <h3>{_ICON_LIST} Pontos-Chave</h3>
+                        <div class="pontos-chave">
+                            {card['pontos_chave']}
+                        </div>
+                    </div>
+                </div>
+                
+                <div class="news-footer">
+                    <a href="{card['url']}" target="_blank" class="read-more">
+                        {_ICON_LINK}
+                        Ler notícia completa
+                    </a>
+                    <span class="author">Por: {card['author']}</span>
+                </div>
+            </article>
+            """
+    
+    def _format_pontos_chave(self, pontos_chave: str) -> str:
+        """Formatar pontos-chave como lista HTML"""
+        if not pontos_chave:
+            return "<p>Pontos-chave não disponíveis</p>"
+        
+        formatted_lines = [
+            # Remover marcador e adicionar como item de lista
+            f"<li>{html.escape(line[1:].strip())}</li>"
+            for line in (raw.strip() for raw in pontos_chave.split('\n'))
+            if line.startswith(('•', '-'))
+        ]
+        
+        return f"<ul>{''.join(formatted_lines)}</ul>" if formatted_lines else f"<p>{html.escape(pontos_chave)}</p>"
+    
+    def _format_date(self, date_str: str) -> str:
+        """Formatar data para exibição"""
+        if not date_str or date_str == "Data não encontrada":
+            return "Data não disponível"
+        
+        try:
+            # Caminho rápido: datas ISO 8601 vindas dos feeds e das páginas
+            try:
+                dt = datetime.fromisoformat(date_str[:19])
+                return f"{dt.day:02d}/{dt.month:02d}/{dt.year}"
+            except ValueError:
+                pass
+            
+            # Tentar outros formatos de data
+            for fmt in ['%d/%m/%Y']:
+                try:
+                    dt = datetime.strptime(date_str[:19], fmt)
+                    return f"{dt.day:02d}/{dt.month:02d}/{dt.year}"
+                except ValueError:
+                    continue
+            return date_str
+        except:
+            return "Data não disponível"
+    
+    def _generate_css(self):
+        """Gerar arquivo CSS"""
+        self._write_if_changed(self.output_dir / "styles.css", _CSS_BYTES)
+    
+    def _generate_js(self):
+        """Gerar arquivo JavaScript"""
+        self._write_if_changed(self.output_dir / "script.js", _JS_BYTES)
+    
+    def _write_if_changed(self, target: Path, data: bytes):
+        """Gravar o arquivo e sua versão .gz apenas se o conteúdo em disco for diferente"""
+        gz_target = target.with_name(target.name + '.gz')
+        if target.exists() and gz_target.exists() and target.read_bytes() == data:
+            return
+        target.write_bytes(data)
+        
+        # Versão pré-comprimida para CDNs e espelhos (mtime fixo para saída determinística)
+        gz_target.write_bytes(gzip.compress(data, compresslevel=6, mtime=0))
+    
+    def _build_api_meta(self, analyzed_news: List[Dict], sources: Set[str], iso_ts: str) -> Dict:
+        """Montar os metadados da API"""
+        return {
+            'timestamp': iso_ts,
             'total_news': len(analyzed_news),
-            'sources': list(set([news['source'] for news in analyzed_news])),
-            'news': analyzed_news
+            'sources': sorted(sources)
         }
+    
+    def _build_json_api(self, analyzed_news: List[Dict], api_meta: Dict) -> bytes:
+        """Montar o conteúdo do arquivo JSON para API"""
+        api_data = {**api_meta, 'news': analyzed_news}
+        
+        # orjson gera bytes UTF-8 sem escapar caracteres não-ASCII; sem indentação em produção
+        return orjson.dumps(api_data)
+    
+    def _write_json_api(self, payload: bytes):
+        """Gravar arquivo JSON para API"""
+        self._write_if_changed(self.output_dir / "api.json", payload)
+    
+    def _write_pretty_json_api(self, analyzed_news: List[Dict], api_meta: Dict):
+        """Gravar a API indentada em api.pretty.json"""
+        api_data = {**api_meta, 'news': analyzed_news}
+        (self.output_dir / "api.pretty.json").write_bytes(orjson.dumps(api_data, option=orjson.OPT_INDENT_2))
+    
+    def _write_ndjson_api(self, analyzed_news: List[Dict], api_meta: Dict):
+        """Gravar a API em NDJSON (uma notícia por linha) e os metadados em arquivo separado"""
+        # Serializar registro a registro: consumidores podem ler em streaming
+        with open(self.output_dir / "api.ndjson", 'wb') as f:
+            for news in analyzed_news:
+                f.write(orjson.dumps(news, option=orjson.OPT_APPEND_NEWLINE))
         
-        with open(self.output_dir / "api.json", 'w', encoding='utf-8') as f:
-            json.dump(api_data, f, ensure_ascii=False, indent=2)
\ No newline at end of file
+        (self.output_dir / "api_meta.json").write_bytes(orjson.dumps(api_meta))
\ No newline at end of file
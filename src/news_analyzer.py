@@ -3,29 +3,168 @@ Módulo para análise de notícias usando Ollama como provedor principal com sis
 """
 
 import os
+import sys
+import importlib.util
 import json
 import logging
+import random
+import re
+import threading
+import time
 import requests
-from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from pathlib import Path
+from typing import Any, Callable, FrozenSet, List, Dict, Optional, Tuple
 try:
-    from openai import OpenAI
+    import orjson
+    _json_loads = orjson.loads
 except ImportError:
-    OpenAI = None
-from dotenv import load_dotenv
+    # Ambiente de desenvolvimento sem orjson: json da stdlib também aceita bytes
+    _json_loads = json.loads
+from src.utils.llm_cache import LLMCache, cache_key
+from src.utils.news import WHITESPACE_RE
+
+# O SDK da OpenAI é pesado de importar: verificar só se está instalado e importar no primeiro uso
+_OPENAI_AVAILABLE = importlib.util.find_spec("openai") is not None
+
+_ENV_LOADED = False
+
+def _ensure_env():
+    """Carregar o .env uma única vez por processo"""
+    global _ENV_LOADED
+    if not _ENV_LOADED:
+        from dotenv import load_dotenv
+        load_dotenv()
+        _ENV_LOADED = True
+
+@dataclass(slots=True)
+class Provider:
+    """Provedor de LLM configurado e pronto para uso"""
+    name: str
+    api_key: Optional[str]
+    base_url: str
+    model: str
+    client: Any
+    kind: str  # 'openai_compatible' ou 'huggingface'
+    priority: int
+    timeout: float
+    # Hugging Face: cabeçalhos e URL do modelo montados uma única vez
+    headers: Optional[Dict[str, str]] = None
+    url: Optional[str] = None
+
+# Linha de cabeçalho de seção da resposta do LLM (com ou sem ## / **), capturando o nome da seção
+_SECTION_RE = re.compile(
+    r'^.*?(RESUMO EXECUTIVO|PONTOS[- ]CHAVE|N[ÍI]VEL DE RELEV[ÂA]NCIA|T[ÍI]TULO[_ ]TRADUZIDO|RESUMO[_ ]TRADUZIDO).*$',
+    re.IGNORECASE | re.MULTILINE
+)
+
+# Seção correspondente a cada cabeçalho, após normalização (maiúsculas, sem acentos, hífens e sublinhados)
+_SECTION_KEYS = {
+    'RESUMO EXECUTIVO': 'resumo_executivo',
+    'PONTOS CHAVE': 'pontos_chave',
+    'NIVEL DE RELEVANCIA': 'nivel_relevancia',
+    'TITULO TRADUZIDO': 'titulo_traduzido',
+    'RESUMO TRADUZIDO': 'resumo_traduzido'
+}
+_HEADER_NORMALIZE = str.maketrans({'Í': 'I', 'Â': 'A', '-': ' ', '_': ' '})
+
+# Seções esperadas na resposta, sem e com tradução
+_ANALYSIS_SECTIONS = frozenset(['resumo_executivo', 'pontos_chave', 'nivel_relevancia'])
+_TRANSLATED_SECTIONS = _ANALYSIS_SECTIONS | {'titulo_traduzido', 'resumo_traduzido'}
+
+# Qualquer cabeçalho markdown (início de uma seção extra após a última esperada)
+_MD_HEADER_RE = re.compile(r'^#', re.MULTILINE)
+
+# Prompts fixos: o texto estático vem antes da notícia para que o prefixo seja idêntico
+# em todas as chamadas e aproveite o cache de prefixo dos provedores
+_SYSTEM_PROMPT = (
+    "Você é um analista especializado em inteligência artificial e tecnologia. Sua tarefa é analisar notícias "
+    "sobre IA e fornecer insights específicos para desenvolvedores de software e empresas do ramo "
+    "imobiliário/shopping centers. Responda sempre em português brasileiro."
+)
+
+_ANALYSIS_TEMPLATE = """Analise a notícia sobre inteligência artificial e tecnologia apresentada ao final.
+
+Por favor, forneça uma análise estruturada seguindo EXATAMENTE este formato (mantenha os cabeçalhos):
+
+## RESUMO EXECUTIVO
+[Resumo da notícia, em português brasileiro]
+
+## PONTOS-CHAVE
+[3-5 pontos principais desta notícia em formato de lista]
+
+## NÍVEL DE RELEVÂNCIA
+[Alto/Médio/Baixo] - [Justificativa em uma frase]
+
+IMPORTANTE: Responda sempre em português brasileiro e mantenha exatamente os cabeçalhos mostrados acima.
+
+**Título:** {title}
+
+**Conteúdo:** {content}
+"""
+
+_TRANSLATION_TEMPLATE = """
+Inclua também, ao final, estas seções:
+
+## TÍTULO TRADUZIDO
+[Título da notícia traduzido para português brasileiro]
+
+## RESUMO TRADUZIDO
+[Tradução para português brasileiro deste resumo: {summary}]
+"""
+
+# Palavras frequentes em português, usadas na detecção simples de idioma
+_PT_STOPWORDS = frozenset(['de', 'da', 'do', 'para', 'com', 'em', 'por', 'uma', 'um', 'que', 'não', 'são', 'como', 'mais', 'sobre', 'pela', 'pelo'])
+
+@lru_cache(maxsize=4096)
+def _is_portuguese(text: str) -> bool:
+    """Verificar se o texto está em português (resultado memoizado por texto)"""
+    words = text.lower().split()
+    portuguese_count = sum(1 for word in words if word in _PT_STOPWORDS)
+    return portuguese_count >= 2 or len(words) < 5
 
 class NewsAnalyzer:
     """Analisador de notícias usando Ollama como provedor principal com fallback"""
     
+    # Palavras-chave da análise local
+    _HIGH_RELEVANCE_KEYWORDS = frozenset(['openai', 'chatgpt', 'claude', 'gemini', 'breakthrough', 'revolutionary', 'billion', 'funding', 'ipo', 'acquisition'])
+    _MEDIUM_RELEVANCE_KEYWORDS = frozenset(['ai', 'artificial intelligence', 'machine learning', 'deep learning', 'neural', 'algorithm', 'automation', 'robot'])
+    _LOW_RELEVANCE_KEYWORDS = frozenset(['update', 'minor', 'patch', 'bug', 'fix'])
+    _TOPIC_KEYWORDS = frozenset(['google', 'microsoft', 'investment', 'enterprise', 'business', 'developer', 'api'])
+    
+    # Todas as palavras-chave em uma única expressão, para varrer o texto uma só vez.
+    # O lookahead encontra ocorrências sobrepostas, como 'ai' dentro de 'openai'
+    _KEYWORD_RE = re.compile('(?=(' + '|'.join(map(re.escape, sorted(
+        _HIGH_RELEVANCE_KEYWORDS | _MEDIUM_RELEVANCE_KEYWORDS | _LOW_RELEVANCE_KEYWORDS | _TOPIC_KEYWORDS,
+        key=len, reverse=True))) + '))')
+    
+    # Último health check do Ollama por URL: (instante, disponível), compartilhado entre instâncias
+    _ollama_checks: Dict[str, Tuple[float, bool]] = {}
+    _OLLAMA_CHECK_TTL = 30.0
+    
+    # Chamadas entre reordenações da lista de provedores
+    _STATS_SORT_INTERVAL = 10
+    # Taxa de erro recente a partir da qual o provedor vai para o fim da lista
+    _MAX_ERROR_RATE = 0.5
+    
     def __init__(self):
-        load_dotenv()
+        _ensure_env()
         self.logger = logging.getLogger(__name__)
         
+        # Timeout por chamada (segundos): Ollama local pode ser lento, APIs na nuvem não devem travar o pipeline
+        llm_timeout = float(os.getenv('LLM_TIMEOUT', '20'))
+        
         # Configurações dos provedores em ordem de prioridade (Ollama primeiro)
         self.providers = {
             'ollama': {
                 'api_key': 'local',  # Ollama não precisa de API key
                 'base_url': os.getenv('OLLAMA_BASE_URL', 'http://localhost:11434/v1'),
                 'model': os.getenv('OLLAMA_MODEL', 'llama3:latest'),
+                'timeout': float(os.getenv('OLLAMA_TIMEOUT', '60')),
                 'free': True,
                 'priority': 1
             },
@@ -33,6 +172,7 @@ class NewsAnalyzer:
                 'api_key': os.getenv('OPENROUTER_API_KEY'),
                 'base_url': 'https://openrouter.ai/api/v1',
                 'model': os.getenv('DEFAULT_MODEL', 'meta-llama/llama-3.3-70b-instruct:free'),
+                'timeout': llm_timeout,
                 'free': True,
                 'priority': 2
             },
@@ -40,6 +180,7 @@ class NewsAnalyzer:
                 'api_key': os.getenv('GROQ_API_KEY'),
                 'base_url': 'https://api.groq.com/openai/v1',
                 'model': os.getenv('GROQ_MODEL', 'llama3-8b-8192'),
+                'timeout': llm_timeout,
                 'free': True,
                 'priority': 3
             },
@@ -47,6 +188,7 @@ class NewsAnalyzer:
                 'api_key': os.getenv('TOGETHER_API_KEY'),
                 'base_url': 'https://api.together.xyz/v1',
                 'model': os.getenv('TOGETHER_MODEL', 'meta-llama/Llama-2-7b-chat-hf'),
+                'timeout': llm_timeout,
                 'free': False,  # $1 crédito inicial
                 'priority': 4
             },
@@ -54,28 +196,90 @@ class NewsAnalyzer:
                 'api_key': os.getenv('HUGGINGFACE_API_KEY'),
                 'base_url': 'https://api-inference.huggingface.co/models',
                 'model': os.getenv('HUGGINGFACE_MODEL', 'microsoft/DialoGPT-medium'),
+                'timeout': llm_timeout,
                 'free': True,
                 'priority': 5
             }
         }
         
+        # Sessão HTTP compartilhada (keep-alive) para o health check do Ollama e o Hugging Face.
+        # Sem novas tentativas por padrão: com o Ollama desligado o health check falha na hora
+        self._http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=0)
+        self._http.mount('http://', adapter)
+        self._http.mount('https://', adapter)
+        
+        # Apenas as chamadas ao Hugging Face repetem em erros transitórios do servidor.
+        # A chamada é um POST, que o urllib3 não repete por padrão; rate limit (429) fica
+        # a cargo de _call_with_backoff. Esgotadas as tentativas, a última resposta é devolvida
+        self._http.mount(self.providers['huggingface']['base_url'], HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[500, 502, 503, 504],
+                              allowed_methods=frozenset({'POST'}), respect_retry_after_header=True,
+                              raise_on_status=False)
+        ))
+        
+        # Pool de conexões compartilhado pelos clientes OpenAI, criado junto com o primeiro cliente
+        self._http_client = None
+        
         # Tentar configurar provedores em ordem de prioridade
         self.available_providers = []
         self._setup_providers()
         
         self.analysis_enabled = os.getenv('ANALYSIS_ENABLED', 'true').lower() == 'true'
+        self.max_content_chars = int(os.getenv('MAX_CONTENT_CHARS', '2000'))
         self.current_provider_index = 0
+        
+        # Modelo do provedor principal por prioridade, fixo para a chave do cache
+        # (a ordem de available_providers muda conforme as estatísticas)
+        self._cache_model = self.available_providers[0].model if self.available_providers else None
+        
+        # Latência (média móvel exponencial) e taxa de erro por provedor, persistidas entre execuções
+        self._stats_lock = threading.Lock()
+        self._stats_path = Path('logs') / 'provider_stats.json'
+        self._stats = self._load_provider_stats()
+        self._calls_since_sort = 0
+        self._sort_providers()
+        
+        # Cache em disco das análises: notícias repetidas não voltam ao LLM
+        self.cache = None
+        if os.getenv('LLM_CACHE_ENABLED', 'true').lower() == 'true':
+            self.cache = LLMCache(Path(os.getenv('LLM_CACHE_PATH', '.llm_cache.sqlite')))
+    
+    def _make_provider(self, name: str, config: Dict, client: Any, kind: str) -> Provider:
+        """Criar o provedor configurado a partir da sua configuração"""
+        return Provider(
+            name=name,
+            api_key=config['api_key'],
+            base_url=config['base_url'],
+            model=config['model'],
+            client=client,
+            kind=kind,
+            priority=config['priority'],
+            timeout=config['timeout']
+        )
     
     def _check_ollama_availability(self):
-        """Verificar se Ollama está rodando e disponível"""
+        """Verificar se Ollama está rodando e disponível (resultado reaproveitado por alguns segundos)"""
+        ollama_url = os.getenv('OLLAMA_BASE_URL', 'http://localhost:11434')
+        # Remover /v1 se estiver presente para o health check
+        health_url = ollama_url.replace('/v1', '') + '/api/tags'
+        
+        cached = NewsAnalyzer._ollama_checks.get(health_url)
+        if cached and time.monotonic() - cached[0] < self._OLLAMA_CHECK_TTL:
+            return cached[1]
+        
+        available = self._probe_ollama(health_url)
+        NewsAnalyzer._ollama_checks[health_url] = (time.monotonic(), available)
+        return available
+    
+    def _probe_ollama(self, health_url: str) -> bool:
+        """Consultar o endpoint de modelos do Ollama"""
         try:
-            ollama_url = os.getenv('OLLAMA_BASE_URL', 'http://localhost:11434')
-            # Remover /v1 se estiver presente para o health check
-            health_url = ollama_url.replace('/v1', '') + '/api/tags'
-            
-            response = requests.get(health_url, timeout=5)
+            response = self._http.get(health_url, timeout=5)
             if response.status_code == 200:
-                models = response.json().get('models', [])
+                models = _json_loads(response.content).get('models', [])
                 if models:
                     self.logger.info(f"🦙 Ollama disponível com {len(models)} modelos")
                     return True
@@ -97,16 +301,8 @@ class NewsAnalyzer:
                 # Verificar se Ollama está rodando
                 if self._check_ollama_availability():
                     try:
-                        client = OpenAI(
-                            api_key='ollama',  # Ollama não precisa de key real
-                            base_url=config['base_url']
-                        )
-                        self.available_providers.append({
-                            'name': provider_name,
-                            'config': config,
-                            'client': client,
-                            'type': 'openai_compatible'
-                        })
+                        client = self._create_openai_client('ollama', config['base_url'])  # Ollama não precisa de key real
+                        self.available_providers.append(self._make_provider(provider_name, config, client, 'openai_compatible'))
                         self.logger.info(f"✅ Provedor {provider_name} configurado (local) - PRIORIDADE 1")
                     except Exception as e:
                         self.logger.warning(f"❌ Erro ao configurar {provider_name}: {e}")
@@ -116,96 +312,201 @@ class NewsAnalyzer:
                 try:
                     if provider_name == 'huggingface':
                         # Hugging Face usa requests diretamente
-                        self.available_providers.append({
-                            'name': provider_name,
-                            'config': config,
-                            'client': None,
-                            'type': 'huggingface'
-                        })
-                    elif OpenAI:
+                        provider = self._make_provider(provider_name, config, None, 'huggingface')
+                        provider.headers = {"Authorization": f"Bearer {config['api_key']}"}
+                        provider.url = f"{config['base_url']}/{config['model']}"
+                        self.available_providers.append(provider)
+                    elif _OPENAI_AVAILABLE:
                         # Outros provedores usam OpenAI client
-                        client = OpenAI(
-                            api_key=config['api_key'],
-                            base_url=config['base_url']
-                        )
-                        self.available_providers.append({
-                            'name': provider_name,
-                            'config': config,
-                            'client': client,
-                            'type': 'openai_compatible'
-                        })
+                        client = self._create_openai_client(config['api_key'], config['base_url'])
+                        self.available_providers.append(self._make_provider(provider_name, config, client, 'openai_compatible'))
                     
                     self.logger.info(f"✅ Provedor {provider_name} configurado - PRIORIDADE {config['priority']}")
                 except Exception as e:
                     self.logger.warning(f"❌ Erro ao configurar {provider_name}: {e}")
         
         if self.available_providers:
-            primary_provider = self.available_providers[0]['name']
+            primary_provider = self.available_providers[0].name
             self.logger.info(f"🔧 {len(self.available_providers)} provedores disponíveis")
             self.logger.info(f"🎯 Provedor principal: {primary_provider}")
-            self.logger.info(f"📋 Ordem: {[p['name'] for p in self.available_providers]}")
+            self.logger.info(f"📋 Ordem: {[p.name for p in self.available_providers]}")
         else:
             self.logger.warning("⚠️ Nenhum provedor de LLM configurado. Usando análise local.")
     
+    def _create_openai_client(self, api_key: str, base_url: str) -> Any:
+        """Criar um cliente OpenAI, importando o SDK apenas quando algum provedor precisa dele"""
+        from openai import OpenAI
+        
+        if self._http_client is None:
+            import httpx
+            self._http_client = httpx.Client(limits=httpx.Limits(max_connections=32, max_keepalive_connections=32))
+        
+        # Sem novas tentativas do SDK: timeout passa direto para o próximo provedor
+        # e rate limit é tratado só por _call_with_backoff
+        return OpenAI(api_key=api_key, base_url=base_url, http_client=self._http_client, max_retries=0)
+    
     def analyze_news(self, news_item: Dict) -> Optional[Dict]:
         """Analisar uma notícia usando sistema de fallback"""
         
-        self.logger.info(f"🔍 Iniciando análise da notícia: {news_item.get('title', 'N/A')[:50]}...")
+        self.logger.debug("🔍 Iniciando análise da notícia: %.50s...", news_item.get('title', 'N/A'))
         
         if not self.analysis_enabled:
-            self.logger.info("📝 Análise desabilitada, usando análise local")
+            self.logger.debug("📝 Análise desabilitada, usando análise local")
             return self._local_analysis(news_item)
         
-        # Tentar cada provedor disponível
-        for i, provider in enumerate(self.available_providers):
+        # Consultar o cache antes de chamar qualquer provedor
+        key = None
+        if self.cache and self._cache_model:
+            key = cache_key(self._cache_model, news_item)
+            cached = self.cache.get(key)
+            if cached is not None:
+                self.logger.debug("💾 Análise obtida do cache")
+                return cached
+        
+        # Tentar cada provedor disponível, do mais rápido para o mais lento
+        providers = self.available_providers
+        for i, provider in enumerate(providers):
+            started = time.monotonic()
             try:
-                self.logger.info(f"🚀 Tentando provedor {provider['name']} ({i+1}/{len(self.available_providers)})")
+                self.logger.debug("🚀 Tentando provedor %s (%d/%d)", provider.name, i + 1, len(providers))
                 
-                if provider['type'] == 'huggingface':
+                if provider.kind == 'huggingface':
                     result = self._analyze_with_huggingface(news_item, provider)
                 else:
                     result = self._analyze_with_openai_compatible(news_item, provider)
                 
+                self._record_provider_result(provider.name, (time.monotonic() - started) * 1000, bool(result))
+                
                 if result:
-                    self.logger.info(f"✅ Análise concluída com {provider['name']}")
+                    self.logger.debug("✅ Análise concluída com %s", provider.name)
+                    if key:
+                        self.cache.set(key, result)
                     return result
                     
             except Exception as e:
-                self.logger.warning(f"❌ Erro com {provider['name']}: {str(e)}")
+                self._record_provider_result(provider.name, (time.monotonic() - started) * 1000, False)
+                self.logger.warning(f"❌ Erro com {provider.name}: {str(e)}")
                 
-                # Se for rate limit, tentar próximo provedor
-                if "429" in str(e) or "rate" in str(e).lower():
-                    self.logger.info(f"⏳ Rate limit em {provider['name']}, tentando próximo...")
+                # Rate limit persistente (backoff esgotado): tentar próximo provedor
+                if self._is_rate_limit(e) or "rate" in str(e).lower():
+                    self.logger.info(f"⏳ Rate limit em {provider.name} após novas tentativas, tentando próximo...")
                     continue
                 else:
-                    self.logger.error(f"🔍 Erro técnico em {provider['name']}: {type(e).__name__}")
+                    self.logger.error(f"🔍 Erro técnico em {provider.name}: {type(e).__name__}")
         
         # Se todos os provedores falharam, usar análise local
         self.logger.warning("⚠️ Todos os provedores falharam, usando análise local")
         return self._local_analysis(news_item)
     
-    def _analyze_with_openai_compatible(self, news_item: Dict, provider: Dict) -> Optional[Dict]:
+    def _load_provider_stats(self) -> Dict[str, Dict]:
+        """Carregar as estatísticas dos provedores salvas em execuções anteriores"""
+        stats = {}
+        try:
+            stats = json.loads(self._stats_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            pass
+        
+        # Provedores sem histórico não têm latência: ficam atrás dos já medidos
+        for name in self.providers:
+            entry = stats.setdefault(name, {'ewma_ms': None, 'error_rate': 0.0, 'errors': 0, 'ok': 0})
+            if not entry.get('ok'):
+                entry['ewma_ms'] = None
+            entry.setdefault('error_rate', 0.0)
+        return stats
+    
+    def _record_provider_result(self, name: str, elapsed_ms: float, ok: bool):
+        """Atualizar latência e taxa de erro do provedor, reordenando a lista periodicamente"""
+        with self._stats_lock:
+            stats = self._stats[name]
+            # Latência só de chamadas bem-sucedidas: uma falha rápida não torna o provedor "rápido"
+            if ok:
+                ewma = stats['ewma_ms']
+                stats['ewma_ms'] = elapsed_ms if ewma is None else 0.8 * ewma + 0.2 * elapsed_ms
+            stats['error_rate'] = 0.8 * stats['error_rate'] + (0.0 if ok else 0.2)
+            stats['ok' if ok else 'errors'] += 1
+            
+            self._calls_since_sort += 1
+            if self._calls_since_sort < self._STATS_SORT_INTERVAL:
+                return
+            self._calls_since_sort = 0
+            self._sort_providers()
+            self._save_provider_stats()
+    
+    def _sort_providers(self):
+        """Ordenar os provedores: medidos por tempo esperado até uma análise, depois os não testados, por fim os que falham"""
+        def score(provider: Provider) -> Tuple[int, float, int]:
+            stats = self._stats[provider.name]
+            error_rate = stats['error_rate']
+            
+            # Nunca respondeu com sucesso ou erra com frequência: fim da lista
+            if (stats['errors'] and not stats['ok']) or error_rate >= self._MAX_ERROR_RATE:
+                return (2, error_rate, provider.priority)
+            
+            # Ainda não testado: mantém a ordem de prioridade, atrás dos medidos
+            if stats['ewma_ms'] is None:
+                return (1, 0.0, provider.priority)
+            
+            # Latência dividida pela chance de sucesso: cada erro custa uma nova tentativa em outro provedor
+            return (0, stats['ewma_ms'] / (1.0 - error_rate), provider.priority)
+        
+        # Nova lista atribuída de uma vez: threads iterando a anterior não são afetadas
+        self.available_providers = sorted(self.available_providers, key=score)
+    
+    def _save_provider_stats(self):
+        """Gravar as estatísticas dos provedores de forma atômica"""
+        try:
+            self._stats_path.parent.mkdir(exist_ok=True)
+            tmp_path = self._stats_path.with_name(self._stats_path.name + '.tmp')
+            tmp_path.write_text(json.dumps(self._stats, indent=2), encoding='utf-8')
+            os.replace(tmp_path, self._stats_path)
+        except OSError as e:
+            self.logger.warning(f"Erro ao salvar estatísticas dos provedores: {e}")
+    
+    def analyze_news_batch(self, news_items: List[Dict], concurrency: int = 10) -> List[Optional[Dict]]:
+        """Analisar várias notícias em paralelo, mantendo a ordem de entrada"""
+        
+        # Erros por notícia vão para o logger do agente, como quando main.py fazia o laço
+        agent_logger = logging.getLogger("ai_news_agent")
+        
+        def analyze(news_item: Dict) -> Optional[Dict]:
+            try:
+                return self.analyze_news(news_item)
+            except Exception as e:
+                agent_logger.error(f"Erro ao analisar notícia: {e}")
+                return None
+        
+        # Chamadas ao LLM são I/O de rede independentes: o número de workers
+        # limita as requisições simultâneas para respeitar o rate limit dos provedores
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+            results = list(executor.map(analyze, news_items))
+        
+        with self._stats_lock:
+            self._save_provider_stats()
+        
+        return results
+    
+    def _analyze_with_openai_compatible(self, news_item: Dict, provider: Provider) -> Optional[Dict]:
         """Analisar usando provedor compatível com OpenAI"""
         
-        # Primeiro, traduzir se necessário (exceto para Ollama que pode ser mais lento)
-        if provider['name'] != 'ollama':
-            translated_item = self._translate_news_item_simple(news_item)
-        else:
-            translated_item = news_item
+        # Tradução pedida na mesma chamada da análise (exceto para Ollama, que pode ser mais lento)
+        translate = provider.name != 'ollama' and not (
+            self._is_portuguese(news_item.get('title', '')) and
+            self._is_portuguese(news_item.get('summary', news_item.get('content', '')))
+        )
         
         # Criar prompt para análise
-        prompt = self._create_analysis_prompt(translated_item)
+        prompt = self._create_analysis_prompt(news_item, translate=translate)
         
         # Configurações específicas para Ollama
-        max_tokens = 1500 if provider['name'] == 'ollama' else 2000
-        temperature = 0.5 if provider['name'] == 'ollama' else 0.7
+        max_tokens = 1500 if provider.name == 'ollama' else 2000
+        temperature = 0.5 if provider.name == 'ollama' else 0.7
         
-        response = provider['client'].chat.completions.create(
-            model=provider['config']['model'],
+        response = self._call_with_backoff(lambda: provider.client.chat.completions.create(
+            model=provider.model,
             messages=[
                 {
                     "role": "system",
-                    "content": "Você é um analista especializado em inteligência artificial e tecnologia. Sua tarefa é analisar notícias sobre IA e fornecer insights específicos para desenvolvedores de software e empresas do ramo imobiliário/shopping centers. Responda sempre em português brasileiro."
+                    "content": _SYSTEM_PROMPT
                 },
                 {
                     "role": "user",
@@ -213,41 +514,88 @@ class NewsAnalyzer:
                 }
             ],
             max_tokens=max_tokens,
-            temperature=temperature
-        )
+            temperature=temperature,
+            timeout=provider.timeout,
+            stream=True
+        ))
         
-        analysis_text = response.choices[0].message.content
+        # Ler em streaming e parar assim que todas as seções pedidas estiverem completas
+        analysis_text = self._read_stream(response, _TRANSLATED_SECTIONS if translate else _ANALYSIS_SECTIONS)
         parsed_analysis = self._parse_analysis_response(analysis_text)
         
-        # Adicionar título e resumo traduzidos
-        parsed_analysis['titulo_traduzido'] = translated_item.get('title', news_item.get('title', ''))
-        parsed_analysis['resumo_traduzido'] = translated_item.get('summary', news_item.get('summary', ''))
-        parsed_analysis['provedor_usado'] = provider['name']  # Indicar qual provedor foi usado
+        # Adicionar título e resumo traduzidos (ou os originais, se não houve tradução)
+        parsed_analysis['titulo_traduzido'] = parsed_analysis.get('titulo_traduzido') or news_item.get('title', '')
+        parsed_analysis['resumo_traduzido'] = parsed_analysis.get('resumo_traduzido') or news_item.get('summary', '')
+        parsed_analysis['provedor_usado'] = provider.name  # Indicar qual provedor foi usado
         
         return parsed_analysis
     
-    def _analyze_with_huggingface(self, news_item: Dict, provider: Dict) -> Optional[Dict]:
+    def _read_stream(self, stream, sections: FrozenSet[str]) -> str:
+        """Acumular a resposta em streaming, encerrando quando outra seção começar após a última das sections"""
+        parts: List[str] = []
+        try:
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content or ''
+                parts.append(delta)
+                
+                # Um novo cabeçalho só pode surgir com uma quebra de linha ou um '#'
+                if '\n' in delta or '#' in delta:
+                    text = ''.join(parts)
+                    end = self._sections_end(text, sections)
+                    if end is not None:
+                        self.logger.debug("📝 Última seção recebida, encerrando o streaming")
+                        # Descartar o que veio depois da seção no mesmo chunk
+                        return text[:end]
+        finally:
+            stream.close()
+        
+        return ''.join(parts)
+    
+    def _sections_end(self, text: str, sections: FrozenSet[str]) -> Optional[int]:
+        """Posição do cabeçalho seguinte à última das sections, ou None enquanto faltar alguma ou ela puder continuar"""
+        # O modelo pode trocar a ordem das seções: esperar até todos os cabeçalhos aparecerem
+        pending = set(sections)
+        start = None
+        for match in _SECTION_RE.finditer(text):
+            pending.discard(_SECTION_KEYS[match.group(1).upper().translate(_HEADER_NORMALIZE)])
+            if not pending:
+                start = match.end()
+                break
+        
+        if start is None:
+            return None
+        
+        # Próxima seção conhecida ou cabeçalho markdown qualquer
+        boundaries = [m.start() for m in (_SECTION_RE.search(text, start), _MD_HEADER_RE.search(text, start)) if m]
+        return min(boundaries) if boundaries else None
+    
+    def _analyze_with_huggingface(self, news_item: Dict, provider: Provider) -> Optional[Dict]:
         """Analisar usando Hugging Face Inference API"""
         
-        headers = {"Authorization": f"Bearer {provider['config']['api_key']}"}
-        
         # Criar prompt simplificado para Hugging Face
         title = news_item.get('title', '')
         content = news_item.get('content', news_item.get('summary', ''))[:500]  # Limitar tamanho
         
         prompt = f"Analise esta notícia de IA: {title}. {content}"
         
-        api_url = f"{provider['config']['base_url']}/{provider['config']['model']}"
+        def post():
+            response = self._http.post(
+                provider.url,
+                headers=provider.headers,
+                json={"inputs": prompt, "parameters": {"max_length": 500}},
+                timeout=(5, provider.timeout)  # (conexão, leitura)
+            )
+            # Rate limit vira exceção para passar pelo backoff
+            if response.status_code == 429:
+                response.raise_for_status()
+            return response
         
-        response = requests.post(
-            api_url,
-            headers=headers,
-            json={"inputs": prompt, "parameters": {"max_length": 500}},
-            timeout=30
-        )
+        response = self._call_with_backoff(post)
         
         if response.status_code == 200:
-            result = response.json()
+            result = _json_loads(response.content)
             if isinstance(result, list) and len(result) > 0:
                 analysis_text = result[0].get('generated_text', '')
                 
@@ -262,144 +610,92 @@ class NewsAnalyzer:
         
         return None
     
-    def _translate_news_item_simple(self, news_item: Dict) -> Dict:
-        """Tradução simples ou manter original se não conseguir traduzir"""
-        
-        title = news_item.get('title', '')
-        summary = news_item.get('summary', news_item.get('content', ''))
+    def _call_with_backoff(self, fn: Callable[[], Any], max_retries: int = 4, base: float = 1.0) -> Any:
+        """Executar fn com backoff exponencial em caso de rate limit, respeitando Retry-After
         
-        # Se já estiver em português, não traduzir
-        if self._is_portuguese(title) and self._is_portuguese(summary):
-            return news_item
-        
-        # Tentar traduzir apenas com o primeiro provedor disponível
-        if self.available_providers:
+        É a única camada de novas tentativas para rate limit: o SDK da OpenAI e o
+        adaptador do Hugging Face não repetem requisições com HTTP 429.
+        """
+        for attempt in range(max_retries + 1):
             try:
-                provider = self.available_providers[0]
-                if provider['type'] == 'openai_compatible':
-                    
-                    translation_prompt = f"""
-Traduza para português brasileiro:
-
-TÍTULO: {title}
-RESUMO: {summary}
-
-Responda apenas:
-TÍTULO_TRADUZIDO: [título em português]
-RESUMO_TRADUZIDO: [resumo em português]
-"""
-                    
-                    response = provider['client'].chat.completions.create(
-                        model=provider['config']['model'],
-                        messages=[
-                            {"role": "system", "content": "Você é um tradutor. Traduza para português brasileiro."},
-                            {"role": "user", "content": translation_prompt}
-                        ],
-                        max_tokens=1000,
-                        temperature=0.3
-                    )
-                    
-                    translation_text = response.choices[0].message.content
-                    
-                    # Parse da tradução
-                    translated_title = title
-                    translated_summary = summary
-                    
-                    lines = translation_text.split('\n')
-                    for line in lines:
-                        if line.startswith('TÍTULO_TRADUZIDO:'):
-                            translated_title = line.replace('TÍTULO_TRADUZIDO:', '').strip()
-                        elif line.startswith('RESUMO_TRADUZIDO:'):
-                            translated_summary = line.replace('RESUMO_TRADUZIDO:', '').strip()
-                    
-                    translated_item = news_item.copy()
-                    translated_item['title'] = translated_title
-                    translated_item['summary'] = translated_summary
-                    
-                    return translated_item
-                    
+                return fn()
             except Exception as e:
-                self.logger.warning(f"❌ Erro na tradução: {e}")
-        
-        return news_item
+                if attempt == max_retries or not self._is_rate_limit(e):
+                    raise
+                
+                # Retry-After do provedor ou backoff exponencial com jitter
+                delay = self._retry_after(e)
+                if delay is None:
+                    delay = random.uniform(0, base * 2 ** attempt)
+                self.logger.info(f"⏳ Rate limit, nova tentativa em {delay:.1f}s ({attempt + 1}/{max_retries})")
+                time.sleep(delay)
+    
+    def _is_rate_limit(self, error: Exception) -> bool:
+        """Verificar se o erro é de rate limit (HTTP 429)"""
+        # Se o SDK nunca foi importado, o erro não pode ter vindo dele
+        openai = sys.modules.get('openai')
+        if openai is not None and isinstance(error, openai.RateLimitError):
+            return True
+        return "429" in str(error)
+    
+    def _retry_after(self, error: Exception, max_delay: float = 60.0) -> Optional[float]:
+        """Obter o tempo de espera pedido pelo provedor no cabeçalho Retry-After"""
+        response = getattr(error, 'response', None)
+        if response is None:
+            return None
+        try:
+            return min(float(response.headers.get('Retry-After')), max_delay)
+        except (TypeError, ValueError):
+            return None
     
     def _is_portuguese(self, text: str) -> bool:
         """Verificar se o texto está em português (verificação simples)"""
-        portuguese_words = ['de', 'da', 'do', 'para', 'com', 'em', 'por', 'uma', 'um', 'que', 'não', 'são', 'como', 'mais', 'sobre', 'pela', 'pelo']
-        words = text.lower().split()
-        portuguese_count = sum(1 for word in words if word in portuguese_words)
-        return portuguese_count >= 2 or len(words) < 5
+        return _is_portuguese(text)
     
-    def _create_analysis_prompt(self, news_item: Dict) -> str:
-        """Criar prompt para análise da notícia"""
+    def _create_analysis_prompt(self, news_item: Dict, translate: bool = False) -> str:
+        """Criar prompt para análise da notícia, opcionalmente pedindo também a tradução"""
         
         title = news_item.get('title', 'N/A')
         content = news_item.get('content', news_item.get('summary', 'N/A'))
         
-        prompt = f"""
-Analise a seguinte notícia sobre inteligência artificial e tecnologia:
-
-**Título:** {title}
-
-**Conteúdo:** {content}
-
-Por favor, forneça uma análise estruturada seguindo EXATAMENTE este formato (mantenha os cabeçalhos):
-
-## RESUMO EXECUTIVO
-[Resumo da notícia, em português brasileiro]
-
-## PONTOS-CHAVE
-[3-5 pontos principais desta notícia em formato de lista]
-
-## NÍVEL DE RELEVÂNCIA
-[Alto/Médio/Baixo] - [Justificativa em uma frase]
-
-IMPORTANTE: Responda sempre em português brasileiro e mantenha exatamente os cabeçalhos mostrados acima.
-"""
+        # Menos tokens de entrada: espaços colapsados e conteúdo limitado
+        content = WHITESPACE_RE.sub(' ', content).strip()[:self.max_content_chars]
+        
+        prompt = _ANALYSIS_TEMPLATE.format(title=title, content=content)
+        
+        # Tradução na mesma resposta, evitando uma chamada separada ao LLM
+        if translate:
+            summary = news_item.get('summary', news_item.get('content', ''))
+            summary = WHITESPACE_RE.sub(' ', summary).strip()[:self.max_content_chars]
+            prompt += _TRANSLATION_TEMPLATE.format(summary=summary)
         
         return prompt
     
     def _parse_analysis_response(self, analysis_text: str) -> Dict:
         """Fazer parse da resposta da análise"""
         
-        self.logger.info("📋 Fazendo parse da resposta da análise...")
-        
         sections = {
-            'resumo_executivo': '',
-            'pontos_chave': '',
-            'nivel_relevancia': ''
+            'resumo_executivo': [],
+            'pontos_chave': [],
+            'nivel_relevancia': []
         }
         
-        current_section = None
-        lines = analysis_text.split('\n')
+        # split com grupo de captura: [preâmbulo, cabeçalho, corpo, cabeçalho, corpo, ...]
+        parts = _SECTION_RE.split(analysis_text)
         
-        for line in lines:
-            line = line.strip()
+        for header, body in zip(parts[1::2], parts[2::2]):
+            current_section = _SECTION_KEYS[header.upper().translate(_HEADER_NORMALIZE)]
             
-            # Detectar seções com ## ou **
-            if ('## RESUMO EXECUTIVO' in line.upper() or 
-                '**RESUMO EXECUTIVO**' in line.upper() or
-                'RESUMO EXECUTIVO' in line.upper()):
-                current_section = 'resumo_executivo'
-                self.logger.debug("📝 Encontrada seção: RESUMO EXECUTIVO")
-            elif ('## PONTOS-CHAVE' in line.upper() or '## PONTOS CHAVE' in line.upper() or
-                  '**PONTOS-CHAVE**' in line.upper() or '**PONTOS CHAVE**' in line.upper() or
-                  'PONTOS-CHAVE' in line.upper() or 'PONTOS CHAVE' in line.upper()):
-                current_section = 'pontos_chave'
-                self.logger.debug("📝 Encontrada seção: PONTOS-CHAVE")
-            elif ('## NÍVEL DE RELEVÂNCIA' in line.upper() or '## NIVEL DE RELEVANCIA' in line.upper() or
-                  '**NÍVEL DE RELEVÂNCIA**' in line.upper() or '**NIVEL DE RELEVANCIA**' in line.upper() or
-                  'NÍVEL DE RELEVÂNCIA' in line.upper() or 'NIVEL DE RELEVANCIA' in line.upper()):
-                current_section = 'nivel_relevancia'
-                self.logger.debug("📝 Encontrada seção: NÍVEL DE RELEVÂNCIA")
-            elif current_section and line and not line.startswith('##') and not line.startswith('**'):
-                # Pular linhas que são apenas marcadores de seção
-                if not any(marker in line.upper() for marker in ['RESUMO EXECUTIVO', 'PONTOS-CHAVE', 'PONTOS CHAVE', 'NÍVEL DE RELEVÂNCIA', 'NIVEL DE RELEVANCIA']):
-                    sections[current_section] += line + '\n'
+            # Pular linhas vazias e marcadores (## ou **)
+            sections.setdefault(current_section, []).extend(
+                line for line in (raw.strip() for raw in body.split('\n'))
+                if line and not line.startswith(('##', '**'))
+            )
         
         # Limpar seções
-        for key in sections:
-            sections[key] = sections[key].strip()
+        sections = {key: '\n'.join(lines).strip() for key, lines in sections.items()}
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("📋 Seções encontradas na resposta: %s", [key for key, text in sections.items() if text])
         
         return sections
     
@@ -409,19 +705,17 @@ IMPORTANTE: Responda sempre em português brasileiro e mantenha exatamente os ca
         title = news_item.get('title', 'N/A')
         content = news_item.get('content', news_item.get('summary', ''))
         
-        self.logger.info("🏠 Gerando análise local inteligente")
-        
-        # Análise de relevância baseada em palavras-chave
-        high_relevance_keywords = ['openai', 'chatgpt', 'claude', 'gemini', 'breakthrough', 'revolutionary', 'billion', 'funding', 'ipo', 'acquisition']
-        medium_relevance_keywords = ['ai', 'artificial intelligence', 'machine learning', 'deep learning', 'neural', 'algorithm', 'automation', 'robot']
-        low_relevance_keywords = ['update', 'minor', 'patch', 'bug', 'fix']
+        self.logger.debug("🏠 Gerando análise local inteligente")
         
         text_lower = (title + ' ' + content).lower()
         
+        # Palavras-chave presentes no texto, encontradas em uma única varredura
+        found = set(self._KEYWORD_RE.findall(text_lower))
+        
         # Calcular relevância
-        high_count = sum(1 for keyword in high_relevance_keywords if keyword in text_lower)
-        medium_count = sum(1 for keyword in medium_relevance_keywords if keyword in text_lower)
-        low_count = sum(1 for keyword in low_relevance_keywords if keyword in text_lower)
+        high_count = len(found & self._HIGH_RELEVANCE_KEYWORDS)
+        medium_count = len(found & self._MEDIUM_RELEVANCE_KEYWORDS)
+        low_count = len(found & self._LOW_RELEVANCE_KEYWORDS)
         
         if high_count >= 2:
             relevancia = 'Alto - Contém múltiplas palavras-chave de alta relevância'
@@ -434,17 +728,17 @@ IMPORTANTE: Responda sempre em português brasileiro e mantenha exatamente os ca
         
         # Gerar pontos-chave baseados no conteúdo
         pontos_chave = []
-        if 'openai' in text_lower or 'chatgpt' in text_lower:
+        if 'openai' in found or 'chatgpt' in found:
             pontos_chave.append('• Desenvolvimento em OpenAI/ChatGPT')
-        if 'google' in text_lower or 'gemini' in text_lower:
+        if 'google' in found or 'gemini' in found:
             pontos_chave.append('• Inovação do Google em IA')
-        if 'microsoft' in text_lower:
+        if 'microsoft' in found:
             pontos_chave.append('• Iniciativa da Microsoft')
-        if 'funding' in text_lower or 'investment' in text_lower:
+        if 'funding' in found or 'investment' in found:
             pontos_chave.append('• Movimentação de investimentos')
-        if 'enterprise' in text_lower or 'business' in text_lower:
+        if 'enterprise' in found or 'business' in found:
             pontos_chave.append('• Aplicação empresarial')
-        if 'developer' in text_lower or 'api' in text_lower:
+        if 'developer' in found or 'api' in found:
             pontos_chave.append('• Ferramentas para desenvolvedores')
         
         if not pontos_chave:
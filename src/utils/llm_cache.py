@@ -0,0 +1,53 @@
+"""
+LLM Cache
+Cache em disco (SQLite) para as análises geradas pelo LLM
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+def cache_key(model: str, news_item: Dict) -> str:
+    """Chave da análise: modelo usado e conteúdo da notícia (URL, título e início do texto)"""
+    payload = {
+        'model': model,
+        'url': news_item.get('url', ''),
+        'title': news_item.get('title', ''),
+        'content': news_item.get('content', news_item.get('summary', ''))[:2000]
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+class LLMCache:
+    """Cache de respostas em SQLite com tempo de expiração"""
+    
+    def __init__(self, path: Path = Path('.llm_cache.sqlite'), ttl_seconds: int = 7 * 86400):
+        self.ttl_seconds = ttl_seconds
+        # Conexão compartilhada entre threads, protegida por lock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, response TEXT NOT NULL, created_at INTEGER NOT NULL)"
+        )
+        self._conn.commit()
+    
+    def get(self, key: str) -> Optional[Dict]:
+        """Obter resposta em cache, ou None se ausente ou expirada"""
+        with self._lock:
+            row = self._conn.execute("SELECT response, created_at FROM cache WHERE key = ?", (key,)).fetchone()
+        
+        if row is None or time.time() - row[1] > self.ttl_seconds:
+            return None
+        return json.loads(row[0])
+    
+    def set(self, key: str, value: Dict):
+        """Guardar resposta no cache"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, response, created_at) VALUES (?, ?, ?)",
+                (key, json.dumps(value, ensure_ascii=False), int(time.time()))
+            )
+            self._conn.commit()
@@ -3,10 +3,65 @@ Logger Configuration
 Configuração do sistema de logging
 """
 
+import atexit
+import copy
 import logging
 import os
+import queue
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
+from typing import Optional
+import orjson
+
+# Listener que grava os registros em arquivo/console numa thread própria
+_listener: Optional[QueueListener] = None
+# Handler da fila instalado no logger raiz pela última configuração
+_queue_handler: Optional[QueueHandler] = None
+
+def _stop_listener():
+    """Esvaziar a fila e fechar os handlers do listener atual"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+atexit.register(_stop_listener)
+
+class JsonFormatter(logging.Formatter):
+    """Formatar cada registro como uma linha JSON, sem strftime por registro"""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "t": record.created,
+            "lvl": record.levelname,
+            "name": record.name,
+            "msg": record.getMessage()
+        }
+        # Traceback de logger.exception / exc_info=True e pilha de stack_info=True
+        if record.exc_info:
+            data["exc"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            data["exc"] = record.exc_text
+        if record.stack_info:
+            data["stack"] = self.formatStack(record.stack_info)
+        return orjson.dumps(data).decode()
+
+class _LocalQueueHandler(QueueHandler):
+    """Handler da fila que preserva exc_info e stack_info para o formatter do listener
+    
+    O QueueHandler padrão embute o traceback na mensagem e descarta exc_info,
+    pensando em filas entre processos; aqui a fila é local ao processo.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Resolver a mensagem na thread que registrou, como o QueueHandler padrão
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
 
 def setup_logger(log_level: str = "INFO") -> logging.Logger:
     """Configurar sistema de logging"""
@@ -19,14 +74,16 @@ def setup_logger(log_level: str = "INFO") -> logging.Logger:
     timestamp = datetime.now().strftime("%Y%m%d")
     log_file = log_dir / f"ai_news_agent_{timestamp}.log"
     
-    # Configurar formato
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
+    # Configurar formato (JSON por linha, fácil de analisar depois)
+    formatter = JsonFormatter()
+    
+    # Metadados de thread/processo não aparecem nos logs: não coletá-los a cada registro
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
     
-    # Configurar handler para arquivo
-    file_handler = logging.FileHandler(log_file, encoding='utf-8')
+    # Configurar handler para arquivo (rotação limita o crescimento em disco)
+    file_handler = RotatingFileHandler(log_file, maxBytes=10_000_000, backupCount=5, encoding='utf-8')
     file_handler.setFormatter(formatter)
     file_handler.setLevel(getattr(logging, log_level.upper()))
     
@@ -42,11 +99,26 @@ def setup_logger(log_level: str = "INFO") -> logging.Logger:
     # Remover handlers existentes para evitar duplicação
     logger.handlers.clear()
     
-    # Adicionar handlers
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    # Chamadas de log só enfileiram o registro; o I/O fica na thread do listener
+    global _listener, _queue_handler
+    _stop_listener()
+    log_queue = queue.Queue(-1)
+    _listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    _listener.start()
+    
+    # Fila no logger raiz: recebe também os loggers dos módulos (crawlers, analisador, HTML)
+    root = logging.getLogger()
+    if _queue_handler is not None:
+        root.removeHandler(_queue_handler)
+    _queue_handler = _LocalQueueHandler(log_queue)
+    root.addHandler(_queue_handler)
+    root.setLevel(getattr(logging, log_level.upper()))
+    
+    # Bibliotecas HTTP registram cada requisição em INFO
+    for name in ('httpx', 'urllib3'):
+        logging.getLogger(name).setLevel(logging.WARNING)
     
-    # Evitar propagação para o logger raiz
-    logger.propagate = False
+    # Propagar para o logger raiz, onde está a fila
+    logger.propagate = True
     
     return logger
\ No newline at end of file
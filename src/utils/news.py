@@ -0,0 +1,13 @@
+"""
+News Utilities
+Utilitários compartilhados pelos crawlers, pelo analisador e pelo gerador de HTML
+"""
+
+import re
+from operator import itemgetter
+
+# Sequências de espaços em branco (espaços, tabs, quebras de linha)
+WHITESPACE_RE = re.compile(r'\s+')
+
+# Acessor em C para o campo 'source' das notícias
+get_source = itemgetter('source')